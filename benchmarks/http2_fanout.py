@@ -0,0 +1,177 @@
+"""
+Compare runtimes.get fan-outs over HTTP/1.1 and HTTP/2 against a local stand-in server.
+
+The server answers every runtime request after a fixed delay and speaks both HTTP/1.1 and
+plain text HTTP/2, counting the connections opened with each protocol. Each scenario is reported
+with its throughput and its number of connections next to the threaded HTTP/1.1 baseline: HTTP/2
+mainly saves connections, its throughput may be lower or higher depending on the load.
+
+    pip install "httpx[http2]"
+    python benchmarks/http2_fanout.py --requests 2000 --concurrency 200 --delay 0.02
+"""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import h11
+import h2.config
+import h2.connection
+import h2.events
+
+from robo_ai.model.config import Config
+from robo_ai.robo_ai import RoboAi
+from robo_ai.transport.http2_transport import Http2Transport
+from robo_ai.transport.requests_transport import RequestsTransport
+
+HTTP2_PREFACE = b'PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n'
+
+
+class StandInServer(object):
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.connections = {'http/1.1': 0, 'h2': 0}
+        self.port = None
+        self.__loop = asyncio.new_event_loop()
+        self.__started = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self.__run, daemon=True).start()
+        self.__started.wait()
+
+    def __run(self):
+        asyncio.set_event_loop(self.__loop)
+        server = self.__loop.run_until_complete(asyncio.start_server(self.__handle, '127.0.0.1', 0, backlog=1024))
+        self.port = server.sockets[0].getsockname()[1]
+        self.__started.set()
+        self.__loop.run_forever()
+
+    @staticmethod
+    def body(path: str) -> bytes:
+        uuid = path.split('/')[3]
+        return json.dumps({'timestamp': '', 'content': {'assistantUuid': uuid, 'status': 'RUNNING'}}).encode()
+
+    async def __handle(self, reader, writer):
+        try:
+            start = await reader.readexactly(len(HTTP2_PREFACE))
+        except asyncio.IncompleteReadError as error:
+            start = error.partial
+        if start == HTTP2_PREFACE:
+            self.connections['h2'] += 1
+            await self.__handle_h2(start, reader, writer)
+        else:
+            self.connections['http/1.1'] += 1
+            await self.__handle_h11(start, reader, writer)
+        writer.close()
+
+    async def __handle_h2(self, data, reader, writer):
+        connection = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        connection.initiate_connection()
+
+        async def respond(stream_id, path):
+            await asyncio.sleep(self.delay)
+            body = self.body(path)
+            connection.send_headers(stream_id, [(':status', '200'), ('content-type', 'application/json'),
+                                                ('content-length', str(len(body)))])
+            connection.send_data(stream_id, body, end_stream=True)
+            writer.write(connection.data_to_send())
+
+        while data:
+            for event in connection.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    path = dict(event.headers)[b':path'].decode()
+                    asyncio.ensure_future(respond(event.stream_id, path))
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(connection.data_to_send())
+            data = await reader.read(65536)
+
+    async def __handle_h11(self, data, reader, writer):
+        connection = h11.Connection(h11.SERVER)
+        connection.receive_data(data)
+        path = None
+        while True:
+            event = connection.next_event()
+            if event is h11.NEED_DATA:
+                connection.receive_data(await reader.read(65536))
+            elif isinstance(event, h11.Request):
+                path = event.target.decode()
+            elif isinstance(event, h11.EndOfMessage):
+                await asyncio.sleep(self.delay)
+                body = self.body(path)
+                writer.write(connection.send(h11.Response(status_code=200, headers=[
+                    ('content-type', 'application/json'), ('content-length', str(len(body)))])))
+                writer.write(connection.send(h11.Data(data=body)))
+                writer.write(connection.send(h11.EndOfMessage()))
+                connection.start_next_cycle()
+            elif isinstance(event, h11.ConnectionClosed) or connection.our_state is h11.MUST_CLOSE:
+                return
+
+
+def new_client(endpoint: str, transport) -> RoboAi:
+    return RoboAi(Config(endpoint, http_auth={'username': None, 'password': None}, transport=transport))
+
+
+def run_threads(endpoint: str, uuids, concurrency: int):
+    runtimes = new_client(endpoint, RequestsTransport(pool_maxsize=concurrency)).assistants.runtimes
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(runtimes.get, uuids))
+
+
+def run_async(endpoint: str, uuids, concurrency: int, transport: Http2Transport):
+    runtimes = new_client(endpoint, transport).assistants.runtimes
+
+    async def fan_out():
+        slots = asyncio.Semaphore(concurrency)
+
+        async def get(uuid):
+            async with slots:
+                return await runtimes.get_async(uuid)
+
+        await asyncio.gather(*(get(uuid) for uuid in uuids))
+        await transport.aclose()
+
+    asyncio.get_event_loop().run_until_complete(fan_out())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--delay', type=float, default=0.02, help='server latency per request in seconds')
+    args = parser.parse_args()
+
+    server = StandInServer(args.delay)
+    server.start()
+    endpoint = 'http://127.0.0.1:{0}'.format(server.port)
+    uuids = ['bot-{0}'.format(index) for index in range(args.requests)]
+
+    scenarios = [
+        ('requests, HTTP/1.1, threads', lambda: run_threads(endpoint, uuids, args.concurrency)),
+        ('httpx, HTTP/1.1, async', lambda: run_async(
+            endpoint, uuids, args.concurrency, Http2Transport(max_connections=args.concurrency))),
+        ('httpx, HTTP/2, async', lambda: run_async(
+            endpoint, uuids, args.concurrency, Http2Transport(max_connections=4, prior_knowledge=True))),
+    ]
+    print('{0:<30} {1:>10} {2:>10} {3:>12} {4:>16} {5:>16}'.format(
+        'scenario', 'seconds', 'req/s', 'connections', 'req/s vs base', 'conns vs base'))
+    baseline = None
+    for name, scenario in scenarios:
+        before = sum(server.connections.values())
+        started = time.perf_counter()
+        scenario()
+        elapsed = time.perf_counter() - started
+        throughput = args.requests / elapsed
+        connections = sum(server.connections.values()) - before
+        if baseline is None:
+            baseline = (throughput, connections)
+        print('{0:<30} {1:>10.3f} {2:>10.0f} {3:>12} {4:>15.2f}x {5:>15.2f}x'.format(
+            name, elapsed, throughput, connections, throughput / baseline[0],
+            connections / baseline[1] if baseline[1] else 0.0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,272 @@
+"""Command line interface for ROBO.AI, writing one JSON document per line."""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, List
+
+import cattr
+
+from robo_ai.exception.api_error import ApiError
+from robo_ai.fleet.rolling_deploy import RollingDeploy
+from robo_ai.model.config import Config
+from robo_ai.model.deploy.deploy_target import DeployTarget
+from robo_ai.robo_ai import RoboAi
+from robo_ai.token_store.file_token_store import FileTokenStore
+
+
+class JsonLinesWriter(object):
+    """
+    Writes JSON lines to a stream from several threads, flushing after each line.
+
+    Args:
+        stream: text stream to write to.
+    """
+
+    def __init__(self, stream):
+        self.__stream = stream
+        self.__lock = threading.Lock()
+        self.errors = 0
+
+    def write(self, document: dict):
+        if 'error' in document:
+            self.errors += 1
+        line = json.dumps(document, separators=(',', ':'), default=str)
+        with self.__lock:
+            self.__stream.write(line + '\n')
+            self.__stream.flush()
+
+
+def run_parallel(items: Iterable, call: Callable[[object], object], writer: JsonLinesWriter, concurrency: int,
+                 key: str = 'uuid'):
+    """
+    Call a function for each item and write every result as soon as it is available.
+
+    At most concurrency calls are in flight. If writing fails or the user interrupts, the items not
+    started yet are dropped, so a broken pipe or Ctrl-C stops a fan-out such as `runtimes stop`.
+
+    Args:
+        items (Iterable): items to process, usually assistant UUIDs.
+        call (Callable[[object], object]): function returning the result for one item.
+        writer (JsonLinesWriter): where the results are written.
+        concurrency (int): maximum number of calls running at the same time.
+        key (str, optional): name under which the item is written next to its result. Defaults to 'uuid'.
+    """
+    def task(item):
+        try:
+            return {key: item, 'result': cattr.unstructure(call(item))}
+        except (ApiError, Exception) as error:
+            # ApiError derives from BaseException; a failure of one item, e.g. a malformed response,
+            # is written as an error line and does not stop the others
+            return {key: item, 'error': type(error).__name__, 'message': str(error)}
+
+    concurrency = max(1, concurrency)
+    items = iter(items)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = set()
+    try:
+        for item in items:
+            pending.add(executor.submit(task, item))
+            if len(pending) >= concurrency:
+                break
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                writer.write(future.result())
+                for item in items:
+                    pending.add(executor.submit(task, item))
+                    break
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def new_log_lines(previous: List[str], current: List[str]) -> List[str]:
+    """
+    Return the lines of the current log tail that were not in the previous one.
+
+    Args:
+        previous (List[str]): lines returned by the previous fetch.
+        current (List[str]): lines returned by the latest fetch.
+
+    Returns:
+        List[str]: the lines following the longest overlap between both tails.
+    """
+    for overlap in range(min(len(previous), len(current)), 0, -1):
+        if previous[-overlap:] == current[:overlap]:
+            return current[overlap:]
+    return current
+
+
+def read_uuids(uuids: List[str]) -> List[str]:
+    if uuids and uuids != ['-']:
+        return uuids
+    if not uuids and sys.stdin.isatty():
+        return []
+    return [line.strip() for line in sys.stdin if line.strip()]
+
+
+def create_client(args) -> RoboAi:
+    if not args.endpoint:
+        raise SystemExit('robo-ai: the API endpoint is required (--endpoint or ROBO_AI_ENDPOINT)')
+    token_store = FileTokenStore(args.token_file) if args.token_file else None
+    config = Config(
+        args.endpoint,
+        http_auth={
+            'username': args.username,
+            'password': args.password,
+        },
+        token_store=token_store,
+    )
+    robo = RoboAi(config)
+    if args.api_key:
+        robo.set_session_token(robo.oauth.authenticate(args.api_key).access_token)
+    return robo
+
+
+def assistants_list(robo: RoboAi, args, writer: JsonLinesWriter):
+    run_parallel(args.pages, robo.assistants.get_list, writer, args.concurrency, key='page')
+
+
+def assistants_get(robo: RoboAi, args, writer: JsonLinesWriter):
+    run_parallel(read_uuids(args.uuids), robo.assistants.get_assistant, writer, args.concurrency)
+
+
+def runtimes_action(robo: RoboAi, args, writer: JsonLinesWriter):
+    runtimes = robo.assistants.runtimes
+    action = {
+        'get': runtimes.get,
+        'start': runtimes.start,
+        'stop': runtimes.stop,
+        'remove': runtimes.remove,
+    }[args.action]
+    run_parallel(read_uuids(args.uuids), action, writer, args.concurrency)
+
+
+def logs(robo: RoboAi, args, writer: JsonLinesWriter):
+    uuids = read_uuids(args.uuids)
+    previous = {uuid: [] for uuid in uuids}
+
+    def fetch(uuid):
+        lines = robo.assistants.runtimes.get_logs(uuid).content.lines or []
+        new_lines = new_log_lines(previous[uuid], lines)
+        previous[uuid] = lines
+        return {'lines': new_lines}
+
+    while True:
+        run_parallel(uuids, fetch, writer, args.concurrency)
+        if not args.follow:
+            return
+        time.sleep(args.interval)
+
+
+def deploy(robo: RoboAi, args, writer: JsonLinesWriter):
+    def write_result(result):
+        document = {'uuid': result.assistant_uuid, 'result': cattr.unstructure(result)}
+        if not result.success:
+            document['error'] = result.error
+        writer.write(document)
+
+    rollout = RollingDeploy(
+        robo.assistants.runtimes,
+        concurrency=args.concurrency,
+        wave_size=args.wave_size,
+        canary_fraction=args.canary_fraction,
+        max_failure_ratio=args.max_failure_ratio,
+        poll_interval=args.poll_interval,
+        timeout=args.timeout,
+        result_callback=write_result,
+    )
+    targets = [DeployTarget(uuid, args.package, args.base_runtime) for uuid in read_uuids(args.uuids)]
+    report = rollout.run(targets)
+    summary = report.to_dict()
+    del summary['results']
+    writer.write({'report': summary})
+    if report.halted:
+        writer.errors += 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='robo-ai', description=__doc__)
+    parser.add_argument('--endpoint', default=os.environ.get('ROBO_AI_ENDPOINT'),
+                        help='API base URL (env: ROBO_AI_ENDPOINT)')
+    parser.add_argument('--username', default=os.environ.get('ROBO_AI_HTTP_USERNAME'),
+                        help='basic auth username (env: ROBO_AI_HTTP_USERNAME)')
+    parser.add_argument('--password', default=os.environ.get('ROBO_AI_HTTP_PASSWORD'),
+                        help='basic auth password (env: ROBO_AI_HTTP_PASSWORD)')
+    parser.add_argument('--api-key', default=os.environ.get('ROBO_AI_API_KEY'),
+                        help='API key used to authenticate (env: ROBO_AI_API_KEY)')
+    parser.add_argument('--token-file', default=os.environ.get('ROBO_AI_TOKEN_FILE'),
+                        help='file caching the access token between runs (env: ROBO_AI_TOKEN_FILE)')
+    parser.add_argument('--concurrency', type=int, default=8, help='number of calls running in parallel')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+
+    uuids_help = 'assistant UUIDs, read from stdin when omitted or "-"'
+
+    assistants = commands.add_parser('assistants', help='list and get assistants')
+    assistants_commands = assistants.add_subparsers(dest='action')
+    assistants_commands.required = True
+    list_parser = assistants_commands.add_parser('list', help='list assistants')
+    list_parser.add_argument('pages', nargs='*', type=int, default=[1], help='pages to fetch')
+    list_parser.set_defaults(handler=assistants_list)
+    get_parser = assistants_commands.add_parser('get', help='get assistants')
+    get_parser.add_argument('uuids', nargs='*', help=uuids_help)
+    get_parser.set_defaults(handler=assistants_get)
+
+    runtimes = commands.add_parser('runtimes', help='get, start, stop or remove runtimes')
+    runtimes.add_argument('action', choices=['get', 'start', 'stop', 'remove'])
+    runtimes.add_argument('uuids', nargs='*', help=uuids_help)
+    runtimes.set_defaults(handler=runtimes_action)
+
+    logs_parser = commands.add_parser('logs', help='print runtime logs')
+    logs_parser.add_argument('uuids', nargs='*', help=uuids_help)
+    logs_parser.add_argument('-f', '--follow', action='store_true', help='keep printing new lines')
+    logs_parser.add_argument('--interval', type=float, default=5.0, help='seconds between fetches when following')
+    logs_parser.set_defaults(handler=logs)
+
+    deploy_parser = commands.add_parser('deploy', help='roll a package out to runtimes in waves')
+    deploy_parser.add_argument('uuids', nargs='*', help=uuids_help)
+    deploy_parser.add_argument('--package', required=True, help='path of the bot package')
+    deploy_parser.add_argument('--base-runtime', required=True, help='runtime base version')
+    deploy_parser.add_argument('--wave-size', type=int, default=10)
+    deploy_parser.add_argument('--canary-fraction', type=float, default=0.05)
+    deploy_parser.add_argument('--max-failure-ratio', type=float, default=0.0)
+    deploy_parser.add_argument('--poll-interval', type=float, default=5.0)
+    deploy_parser.add_argument('--timeout', type=float, default=600.0)
+    deploy_parser.set_defaults(handler=deploy)
+
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Run the command line interface.
+
+    Args:
+        argv (List[str], optional): command line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        int: 0 if every call succeeded, 1 otherwise.
+    """
+    args = build_parser().parse_args(argv)
+    writer = JsonLinesWriter(sys.stdout)
+    try:
+        robo = create_client(args)
+        args.handler(robo, args, writer)
+    except ApiError as error:
+        writer.write({'error': type(error).__name__, 'message': str(error)})
+    except BrokenPipeError:
+        # the reading end of the pipe was closed, e.g. by `head`; point stdout to devnull so that
+        # flushing it at exit does not fail again
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except KeyboardInterrupt:
+        return 130
+    return 1 if writer.errors else 0
@@ -0,0 +1,218 @@
+import io
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from robo_ai.exception.api_error import ApiError
+from robo_ai.exception.not_found_error import NotFoundError
+from robo_ai.model.assistant_runtime.assistant_runtime_status import AssistantRuntimeStatus
+from robo_ai.model.deploy.deploy_report import DeployReport
+from robo_ai.model.deploy.deploy_result import DeployResult
+from robo_ai.model.deploy.deploy_target import DeployTarget
+from robo_ai.profiling.profiler import call
+from robo_ai.resources.assistant_runtimes import AssistantRuntimesResource
+from robo_ai.resources.client_resource import RequestMethod
+
+STOPPABLE_STATUSES = {AssistantRuntimeStatus.RUNNING, AssistantRuntimeStatus.STARTING}
+STOPPED_STATUSES = {AssistantRuntimeStatus.STOPPED, AssistantRuntimeStatus.DEAD}
+FAILED_STATUSES = {AssistantRuntimeStatus.DEAD, AssistantRuntimeStatus.REMOVED}
+
+
+class RollingDeploy(object):
+    """
+    Roll bot packages out to many assistant runtimes in waves.
+
+    The first wave is a canary made of a fraction of the targets. Every following wave only starts
+    once the previous one finished and its failure ratio stayed within the allowed threshold;
+    otherwise the rollout halts and the remaining targets are reported as skipped.
+
+    Args:
+        runtimes (AssistantRuntimesResource): resource used to create, update and poll the runtimes.
+        concurrency (int, optional): number of deploys running in parallel inside a wave. Defaults to 4.
+        wave_size (int, optional): maximum number of targets per wave after the canary. Defaults to 10.
+        canary_fraction (float, optional): fraction of the targets deployed in the first wave.
+            Set to 0 to disable the canary wave. Defaults to 0.05.
+        max_failure_ratio (float, optional): failure ratio above which a wave halts the rollout.
+            Defaults to 0, meaning any failure halts it.
+        poll_interval (float, optional): seconds between runtime status checks. Defaults to 5.
+        timeout (float, optional): seconds to wait for a runtime to reach the expected status. Defaults to 600.
+        result_callback (Callable[[DeployResult], None], optional): called as soon as each deploy finishes.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        runtimes: AssistantRuntimesResource,
+        concurrency: int = 4,
+        wave_size: int = 10,
+        canary_fraction: float = 0.05,
+        max_failure_ratio: float = 0.0,
+        poll_interval: float = 5.0,
+        timeout: float = 600.0,
+        result_callback: Callable[[DeployResult], None] = None,
+    ):
+        self.__runtimes = runtimes
+        self.__concurrency = max(1, concurrency)
+        self.__wave_size = max(1, wave_size)
+        self.__canary_fraction = canary_fraction
+        self.__max_failure_ratio = max_failure_ratio
+        self.__poll_interval = poll_interval
+        self.__timeout = timeout
+        self.__result_callback = result_callback
+
+    def plan_waves(self, targets: List[DeployTarget]) -> List[List[DeployTarget]]:
+        """
+        Split the targets into the waves that will be deployed.
+
+        Args:
+            targets (List[DeployTarget]): runtimes to deploy, in rollout order.
+
+        Returns:
+            List[List[DeployTarget]]: the canary wave, if any, followed by waves of at most wave_size targets.
+        """
+        waves = []
+        remaining = list(targets)
+        if remaining and self.__canary_fraction > 0:
+            canary_size = min(len(remaining), max(1, math.ceil(len(remaining) * self.__canary_fraction)))
+            waves.append(remaining[:canary_size])
+            remaining = remaining[canary_size:]
+        for start in range(0, len(remaining), self.__wave_size):
+            waves.append(remaining[start:start + self.__wave_size])
+        return waves
+
+    def run(self, targets: List[DeployTarget]) -> DeployReport:
+        """
+        Deploy all targets wave by wave.
+
+        Args:
+            targets (List[DeployTarget]): runtimes to deploy, in rollout order.
+
+        Returns:
+            DeployReport: see [robo_ai.model.deploy.deploy_report.DeployReport]
+        """
+        started = time.monotonic()
+        waves = self.plan_waves(targets)
+        report = DeployReport(waves=len(waves))
+
+        with ThreadPoolExecutor(max_workers=self.__concurrency) as executor:
+            for index, wave in enumerate(waves):
+                if report.halted:
+                    report.skipped.extend(target.assistant_uuid for target in wave)
+                    continue
+
+                try:
+                    packages = self.__load_packages(wave)
+                except OSError as error:
+                    report.halted = True
+                    report.halt_reason = "Wave {0}: cannot read package ({1})".format(index, error)
+                    report.skipped.extend(target.assistant_uuid for target in wave)
+                    continue
+
+                futures = [executor.submit(self.__deploy_target, index, target, packages) for target in wave]
+                failures = 0
+                try:
+                    for future in as_completed(futures):
+                        result = future.result()
+                        report.results.append(result)
+                        if not result.success:
+                            failures += 1
+                        if self.__result_callback:
+                            self.__result_callback(result)
+                except BaseException:
+                    # interrupted, e.g. by Ctrl-C or a failing callback: do not start the queued deploys
+                    for future in futures:
+                        future.cancel()
+                    raise
+
+                failure_ratio = failures / len(wave)
+                if failure_ratio > self.__max_failure_ratio:
+                    report.halted = True
+                    report.halt_reason = "Wave {0}: {1} of {2} deploys failed".format(index, failures, len(wave))
+
+        report.total_seconds = time.monotonic() - started
+        return report
+
+    @staticmethod
+    def __load_packages(wave: List[DeployTarget]) -> Dict[str, bytes]:
+        packages = {}
+        for target in wave:
+            if target.package_file_path not in packages:
+                with open(target.package_file_path, "rb") as package_file:
+                    packages[target.package_file_path] = package_file.read()
+        return packages
+
+    def __deploy_target(self, wave: int, target: DeployTarget, packages: Dict[str, bytes]) -> DeployResult:
+        started = time.monotonic()
+        result = DeployResult(assistant_uuid=target.assistant_uuid, wave=wave, started_at=time.time())
+        try:
+            status = self.__get_status(target.assistant_uuid)
+            if status is None:
+                result.operation = "create"
+                method = RequestMethod.POST
+            else:
+                result.operation = "update"
+                method = RequestMethod.PUT
+                if status in STOPPABLE_STATUSES:
+                    phase_started = time.monotonic()
+                    self.__runtimes.stop(target.assistant_uuid)
+                    status = self.__wait_for(target.assistant_uuid, STOPPED_STATUSES, set(), status)
+                    result.stop_seconds = time.monotonic() - phase_started
+                    if status not in STOPPED_STATUSES:
+                        result.status = status
+                        result.error = "Timed out waiting for the runtime to stop"
+                        return result
+
+            phase_started = time.monotonic()
+            # the package is uploaded from memory, so the upload is profiled here rather than by update() or create()
+            with call(self.__runtimes.get_config().profiler, "RollingDeploy." + result.operation):
+                self.__runtimes._deploy_file(
+                    method,
+                    target.assistant_uuid,
+                    os.path.basename(target.package_file_path),
+                    io.BytesIO(packages[target.package_file_path]),
+                    target.base_runtime,
+                )
+            result.upload_seconds = time.monotonic() - phase_started
+
+            phase_started = time.monotonic()
+            status = self.__wait_for(target.assistant_uuid, {AssistantRuntimeStatus.RUNNING}, FAILED_STATUSES, status)
+            result.ready_seconds = time.monotonic() - phase_started
+            result.status = status
+            if status == AssistantRuntimeStatus.RUNNING:
+                result.success = True
+            elif status in FAILED_STATUSES:
+                result.error = "Runtime ended in status {0}".format(status.value)
+            else:
+                result.error = "Timed out waiting for the runtime to start"
+        except (ApiError, Exception) as error:
+            # ApiError derives from BaseException; any failure only fails this target, the wave gate decides the rest
+            message = str(error)
+            result.error = "{0}: {1}".format(type(error).__name__, message) if message else type(error).__name__
+        finally:
+            result.total_seconds = time.monotonic() - started
+        return result
+
+    def __get_status(self, assistant_uuid: str) -> Optional[AssistantRuntimeStatus]:
+        try:
+            return self.__runtimes.get(assistant_uuid).content.status
+        except NotFoundError:
+            return None
+
+    def __wait_for(
+        self,
+        assistant_uuid: str,
+        expected: set,
+        failed: set,
+        previous: Optional[AssistantRuntimeStatus],
+    ) -> Optional[AssistantRuntimeStatus]:
+        # a failed status left over from before the operation only counts once the runtime moved away from it
+        deadline = time.monotonic() + self.__timeout
+        while True:
+            status = self.__get_status(assistant_uuid)
+            if status != previous:
+                previous = None
+            if status in expected or (status in failed and previous is None) or time.monotonic() >= deadline:
+                return status
+            time.sleep(self.__poll_interval)
@@ -0,0 +1,317 @@
+import asyncio
+import heapq
+import random
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional
+
+from robo_ai.exception.api_error import ApiError
+from robo_ai.exception.invalid_credentials_error import InvalidCredentialsError
+from robo_ai.exception.invalid_token_error import InvalidTokenError
+from robo_ai.exception.not_authorized_error import NotAuthorizedError
+from robo_ai.exception.not_found_error import NotFoundError
+from robo_ai.model.assistant_runtime.assistant_runtime_status import AssistantRuntimeStatus
+from robo_ai.model.assistant_runtime.assistant_runtime_status_change import AssistantRuntimeStatusChange
+from robo_ai.resources.assistant_runtimes import AssistantRuntimesResource
+
+TRANSIENT_STATUSES = {
+    AssistantRuntimeStatus.UPDATING,
+    AssistantRuntimeStatus.CREATING,
+    AssistantRuntimeStatus.STOPPING,
+    AssistantRuntimeStatus.STARTING,
+    AssistantRuntimeStatus.REMOVING,
+}
+UNHEALTHY_STATUSES = {AssistantRuntimeStatus.DEAD, AssistantRuntimeStatus.UNKNOWN}
+
+# marks a runtime whose status could not be fetched in the current cycle
+_FAILED = object()
+
+# errors that would fail every runtime alike, e.g. an expired token, end the cycle instead of being retried
+_AUTH_ERRORS = (InvalidCredentialsError, InvalidTokenError, NotAuthorizedError)
+
+
+class RuntimeChangeFeed(object):
+    """
+    Keeps a snapshot of the status of many runtimes and notifies only the changes.
+
+    Runtimes are polled by priority: those in a transient status, e.g. STARTING, are polled most often,
+    unhealthy ones, DEAD or UNKNOWN, a bit less and stable ones, e.g. RUNNING or STOPPED, least often.
+    A runtime that does not exist has a None status.
+
+    Args:
+        runtimes (AssistantRuntimesResource): resource used to fetch the runtimes.
+        assistant_uuids (Iterable[str], optional): runtimes to watch. Defaults to None.
+        transient_interval (float, optional): seconds between polls of a runtime in a transient status.
+            Defaults to 5.
+        unhealthy_interval (float, optional): seconds between polls of an unhealthy runtime, or of one whose
+            last poll failed. Defaults to 15.
+        stable_interval (float, optional): seconds between polls of a runtime in a stable status. Defaults to 120.
+        max_calls_per_cycle (int, optional): maximum number of runtimes fetched per cycle, the ones overdue
+            the longest go first. Defaults to None, meaning all due runtimes.
+        concurrency (int, optional): number of runtimes fetched in parallel. Defaults to 8.
+        notify_initial (bool, optional): also notify the first status seen for each runtime. Defaults to False.
+    """
+
+    def __init__(
+        self,
+        runtimes: AssistantRuntimesResource,
+        assistant_uuids: Iterable[str] = None,
+        transient_interval: float = 5.0,
+        unhealthy_interval: float = 15.0,
+        stable_interval: float = 120.0,
+        max_calls_per_cycle: int = None,
+        concurrency: int = 8,
+        notify_initial: bool = False,
+    ):
+        self.__runtimes = runtimes
+        self.__transient_interval = transient_interval
+        self.__unhealthy_interval = unhealthy_interval
+        self.__stable_interval = stable_interval
+        self.__max_calls_per_cycle = max_calls_per_cycle
+        self.__concurrency = max(1, concurrency)
+        self.__notify_initial = notify_initial
+        self.__lock = threading.Lock()
+        self.__watched = set()
+        self.__statuses = {}
+        self.__schedule = []
+        self.__subscribers = []
+        self.__random = random.Random()
+        for assistant_uuid in assistant_uuids or []:
+            self.add(assistant_uuid)
+
+    @property
+    def snapshot(self) -> Dict[str, Optional[AssistantRuntimeStatus]]:
+        """
+        Return the last known status of every watched runtime that was already polled.
+
+        Returns:
+            Dict[str, Optional[AssistantRuntimeStatus]]: statuses indexed by assistant UUID.
+        """
+        with self.__lock:
+            return dict(self.__statuses)
+
+    def add(self, assistant_uuid: str):
+        """
+        Start watching a runtime. It is polled in the next cycle.
+
+        Args:
+            assistant_uuid (str): Unique identifier of the assistant runtime.
+        """
+        with self.__lock:
+            if assistant_uuid not in self.__watched:
+                self.__watched.add(assistant_uuid)
+                heapq.heappush(self.__schedule, (time.monotonic(), assistant_uuid))
+
+    def remove(self, assistant_uuid: str):
+        """
+        Stop watching a runtime.
+
+        Args:
+            assistant_uuid (str): Unique identifier of the assistant runtime.
+        """
+        with self.__lock:
+            self.__watched.discard(assistant_uuid)
+            self.__schedule = [entry for entry in self.__schedule if entry[1] != assistant_uuid]
+            heapq.heapify(self.__schedule)
+            self.__statuses.pop(assistant_uuid, None)
+
+    def subscribe(self, callback: Callable[[AssistantRuntimeStatusChange], None]):
+        """
+        Call a function for every status change detected by poll() or run().
+
+        Args:
+            callback (Callable[[AssistantRuntimeStatusChange], None]): called with each change.
+        """
+        self.__subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[AssistantRuntimeStatusChange], None]):
+        self.__subscribers.remove(callback)
+
+    def seconds_until_next_poll(self) -> Optional[float]:
+        """
+        Return how long until a runtime is due to be polled.
+
+        Returns:
+            Optional[float]: seconds, 0 if some runtime is already due, or None if no runtime is watched.
+        """
+        with self.__lock:
+            if not self.__schedule:
+                return None
+            return max(0.0, self.__schedule[0][0] - time.monotonic())
+
+    def poll(self) -> List[AssistantRuntimeStatusChange]:
+        """
+        Fetch the runtimes that are due and notify the subscribers of their changes.
+
+        Runtimes that cannot be fetched keep their last known status, are retried sooner and are
+        reported with a warning.
+
+        Raises:
+            InvalidCredentialsError: if the credentials are wrong or the token expired.
+            NotAuthorizedError: if the access to the runtimes is forbidden.
+
+        Returns:
+            List[AssistantRuntimeStatusChange]: the changes detected in this cycle.
+        """
+        due = self.__pop_due()
+        if not due:
+            return []
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.__concurrency, len(due))) as executor:
+                statuses = list(executor.map(self.__fetch, due))
+        except BaseException:
+            # the runtimes were taken off the schedule, put them back before giving up on the cycle
+            self.__apply(due, [_FAILED] * len(due))
+            raise
+        return self.__apply(due, statuses)
+
+    async def poll_async(self) -> List[AssistantRuntimeStatusChange]:
+        """
+        Fetch the runtimes that are due from a coroutine and notify the subscribers of their changes.
+
+        Takes the same approach and raises the same errors as poll.
+
+        Returns:
+            List[AssistantRuntimeStatusChange]: the changes detected in this cycle.
+        """
+        due = self.__pop_due()
+        if not due:
+            return []
+        slots = asyncio.Semaphore(self.__concurrency)
+
+        async def fetch(assistant_uuid):
+            async with slots:
+                try:
+                    return (await self.__runtimes.get_async(assistant_uuid)).content.status
+                except NotFoundError:
+                    return None
+                except _AUTH_ERRORS:
+                    raise
+                except (ApiError, Exception) as error:
+                    return error
+
+        try:
+            # exceptions are returned rather than raised so that no fetch is left running unattended
+            statuses = await asyncio.gather(*(fetch(assistant_uuid) for assistant_uuid in due), return_exceptions=True)
+            for status in statuses:
+                if isinstance(status, _AUTH_ERRORS):
+                    raise status
+        except BaseException:
+            # e.g. cancelled mid-cycle, put the runtimes back on the schedule
+            self.__apply(due, [_FAILED] * len(due))
+            raise
+        return self.__apply(due, statuses)
+
+    def run(self, stop_event: threading.Event = None, idle_interval: float = 1.0):
+        """
+        Poll the runtimes as they become due until the stop event is set.
+
+        A cycle that fails for another reason than authentication is reported with a warning and the loop
+        carries on.
+
+        Raises:
+            InvalidCredentialsError: if the credentials are wrong or the token expired.
+            NotAuthorizedError: if the access to the runtimes is forbidden.
+
+        Args:
+            stop_event (threading.Event, optional): ends the loop when set. Defaults to None, running forever.
+            idle_interval (float, optional): seconds between checks when no runtime is watched. Defaults to 1.
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            try:
+                self.poll()
+            except Exception as error:
+                warnings.warn('Runtime change feed poll failed: {0}: {1}'.format(type(error).__name__, error))
+            wait = self.seconds_until_next_poll()
+            stop_event.wait(idle_interval if wait is None else wait)
+
+    async def changes(self, idle_interval: float = 1.0) -> AsyncIterator[AssistantRuntimeStatusChange]:
+        """
+        Poll the runtimes as they become due and yield every change.
+
+        Args:
+            idle_interval (float, optional): seconds between checks when no runtime is watched. Defaults to 1.
+
+        Yields:
+            AssistantRuntimeStatusChange: see
+                [robo_ai.model.assistant_runtime.assistant_runtime_status_change.AssistantRuntimeStatusChange]
+        """
+        while True:
+            for change in await self.poll_async():
+                yield change
+            wait = self.seconds_until_next_poll()
+            await asyncio.sleep(idle_interval if wait is None else wait)
+
+    def __pop_due(self) -> List[str]:
+        now = time.monotonic()
+        due = []
+        with self.__lock:
+            while self.__schedule and self.__schedule[0][0] <= now:
+                if self.__max_calls_per_cycle is not None and len(due) >= self.__max_calls_per_cycle:
+                    break
+                due.append(heapq.heappop(self.__schedule)[1])
+        return due
+
+    def __fetch(self, assistant_uuid: str):
+        try:
+            return self.__runtimes.get(assistant_uuid).content.status
+        except NotFoundError:
+            return None
+        except _AUTH_ERRORS:
+            raise
+        except (ApiError, Exception) as error:
+            return error
+
+    def __apply(self, due: List[str], statuses: list) -> List[AssistantRuntimeStatusChange]:
+        now = time.monotonic()
+        changes = []
+        errors = []
+        with self.__lock:
+            for assistant_uuid, status in zip(due, statuses):
+                if assistant_uuid not in self.__watched:
+                    # removed while it was being fetched
+                    continue
+                if status is _FAILED or isinstance(status, BaseException):
+                    # keep the last known status and retry sooner
+                    interval = self.__unhealthy_interval
+                    if status is not _FAILED:
+                        errors.append(status)
+                else:
+                    interval = self.__interval(status)
+                    known = assistant_uuid in self.__statuses
+                    previous = self.__statuses.get(assistant_uuid)
+                    self.__statuses[assistant_uuid] = status
+                    if (known and previous != status) or (not known and self.__notify_initial):
+                        changes.append(AssistantRuntimeStatusChange(
+                            assistant_uuid=assistant_uuid,
+                            previous_status=previous,
+                            status=status,
+                            detected_at=time.time(),
+                        ))
+                # up to 10% of jitter keeps runtimes seen together from being polled in bursts
+                next_poll = now + interval * (1 + 0.1 * self.__random.random())
+                heapq.heappush(self.__schedule, (next_poll, assistant_uuid))
+
+        if errors:
+            error = errors[-1]
+            warnings.warn('{0} of {1} runtimes could not be fetched, last error {2}: {3}'.format(
+                len(errors), len(due), type(error).__name__, error))
+
+        for change in changes:
+            for callback in list(self.__subscribers):
+                try:
+                    callback(change)
+                except Exception as error:
+                    # a faulty subscriber must not keep the others from being notified
+                    warnings.warn('Runtime change subscriber failed: {0}: {1}'.format(type(error).__name__, error))
+        return changes
+
+    def __interval(self, status: Optional[AssistantRuntimeStatus]) -> float:
+        if status in TRANSIENT_STATUSES:
+            return self.__transient_interval
+        if status in UNHEALTHY_STATUSES:
+            return self.__unhealthy_interval
+        return self.__stable_interval
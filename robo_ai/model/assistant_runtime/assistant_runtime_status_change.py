@@ -0,0 +1,13 @@
+from typing import Optional
+
+import attr
+
+from robo_ai.model.assistant_runtime.assistant_runtime_status import AssistantRuntimeStatus
+
+
+@attr.s(auto_attribs=True)
+class AssistantRuntimeStatusChange(object):
+    assistant_uuid: str = None
+    previous_status: Optional[AssistantRuntimeStatus] = None
+    status: Optional[AssistantRuntimeStatus] = None
+    detected_at: float = None
@@ -1,13 +1,25 @@
+from robo_ai.profiling.profiler import Profiler
+from robo_ai.token_store.token_store import TokenStore
+from robo_ai.transport.requests_transport import RequestsTransport
+from robo_ai.transport.transport import Transport
+
+
 class Config(object):
     __base_endpoint: str = None
     __http_auth: dict = {
         'username': None,
         'password': None
     }
+    __transport: Transport = None
+    __token_store: TokenStore = None
+    __profiler: Profiler = None
 
-    def __init__(self, base_endpoint: str, http_auth: dict):
+    def __init__(self, base_endpoint: str, http_auth: dict, transport: Transport = None,
+                 token_store: TokenStore = None):
         self.__base_endpoint = base_endpoint
         self.__http_auth = http_auth
+        self.__transport = transport or RequestsTransport()
+        self.__token_store = token_store
 
     @property
     def base_endpoint(self) -> str:
@@ -24,3 +36,19 @@ class Config(object):
     @property
     def http_auth_password(self) -> str:
         return self.__http_auth['password']
+
+    @property
+    def transport(self) -> Transport:
+        return self.__transport
+
+    @property
+    def token_store(self) -> TokenStore:
+        return self.__token_store
+
+    @property
+    def profiler(self) -> Profiler:
+        return self.__profiler
+
+    @profiler.setter
+    def profiler(self, profiler: Profiler):
+        self.__profiler = profiler
@@ -0,0 +1,25 @@
+from typing import List
+
+import attr
+import cattr
+
+from robo_ai.model.deploy.deploy_result import DeployResult
+
+
+@attr.s(auto_attribs=True)
+class DeployReport(object):
+    results: List[DeployResult] = attr.Factory(list)
+    waves: int = 0
+    halted: bool = False
+    halt_reason: str = None
+    skipped: List[str] = attr.Factory(list)
+    total_seconds: float = None
+
+    def to_dict(self) -> dict:
+        """
+        Return the report as plain JSON-serializable data.
+
+        Returns:
+            dict: the report with nested results and statuses converted to primitive values.
+        """
+        return cattr.unstructure(self)
@@ -0,0 +1,20 @@
+from typing import Optional
+
+import attr
+
+from robo_ai.model.assistant_runtime.assistant_runtime_status import AssistantRuntimeStatus
+
+
+@attr.s(auto_attribs=True)
+class DeployResult(object):
+    assistant_uuid: str = None
+    wave: int = None
+    operation: str = None
+    success: bool = False
+    status: Optional[AssistantRuntimeStatus] = None
+    error: str = None
+    started_at: float = None
+    stop_seconds: float = None
+    upload_seconds: float = None
+    ready_seconds: float = None
+    total_seconds: float = None
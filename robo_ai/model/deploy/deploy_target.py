@@ -0,0 +1,8 @@
+import attr
+
+
+@attr.s(auto_attribs=True)
+class DeployTarget(object):
+    assistant_uuid: str = None
+    package_file_path: str = None
+    base_runtime: str = None
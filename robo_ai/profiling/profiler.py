@@ -0,0 +1,297 @@
+import asyncio
+import contextvars
+import functools
+import random
+import sys
+import threading
+import time
+from typing import Callable, List, Tuple
+
+_current_frame = contextvars.ContextVar('robo_ai_profiler_frame', default=None)
+
+# marks a call made while an unsampled call is running
+_UNSAMPLED = object()
+
+
+class _Frame(object):
+    def __init__(self, names: Tuple[str, ...], parent: '_Frame' = None):
+        self.names = names
+        self.parent = parent
+        self.child_seconds = 0.0
+        self.active_phase = None
+
+
+class _NoPhase(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NO_PHASE = _NoPhase()
+
+
+class _Phase(object):
+    def __init__(self, profiler: 'Profiler', frame: _Frame, name: str):
+        self.__profiler = profiler
+        self.__frame = frame
+        self.__name = name
+        self.__started = None
+        self.__outer = None
+        self.nested_seconds = 0.0
+
+    def __enter__(self):
+        self.__outer = self.__frame.active_phase
+        self.__frame.active_phase = self
+        self.__started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        elapsed = time.perf_counter() - self.__started
+        self.__frame.active_phase = self.__outer
+        # a phase running inside another one, e.g. 'encode' while 'network' streams the body,
+        # is only counted once, under the inner phase
+        if self.__outer:
+            self.__outer.nested_seconds += elapsed
+        own_seconds = max(0.0, elapsed - self.nested_seconds)
+        self.__frame.child_seconds += own_seconds
+        self.__profiler._record(self.__frame.names + (self.__name,), own_seconds)
+        return False
+
+
+class Profiler(object):
+    """
+    Times every phase of the calls made through the resources.
+
+    Calls of the public resource methods are grouped by method, e.g. 'AssistantsResource.get_list',
+    and split into the phases of the request: 'auth', 'encode', 'network', 'json' and 'structure'.
+    'encode' covers building multipart bodies and reading them while they are sent, which is not
+    counted in 'network'.
+
+    Args:
+        sample_rate (float, optional): fraction of the top level calls that are timed. Defaults to 1.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        self.__sample_rate = sample_rate
+        self.__random = random.Random()
+        self.__lock = threading.Lock()
+        self.__stacks = {}
+        self.__calls = {}
+
+    def call(self, name: str):
+        """
+        Return a context manager timing a resource method call.
+
+        Args:
+            name (str): name of the method, e.g. 'AssistantsResource.get_list'.
+        """
+        return _Call(self, name)
+
+    def phase(self, name: str):
+        """
+        Return a context manager timing a phase of the running call.
+
+        Phases outside a call, or inside a call that was not sampled, are not timed.
+
+        Args:
+            name (str): name of the phase, e.g. 'network'.
+        """
+        frame = _current_frame.get()
+        if frame is None or frame is _UNSAMPLED:
+            return _NO_PHASE
+        return _Phase(self, frame, name)
+
+    def collapsed_stacks(self) -> List[str]:
+        """
+        Return the timings in the collapsed stack format read by flame graph tools.
+
+        Returns:
+            List[str]: one 'frame;frame;phase microseconds' line per stack.
+        """
+        with self.__lock:
+            stacks = dict(self.__stacks)
+        return ['{0} {1}'.format(';'.join(names), int(round(seconds * 1e6)))
+                for names, (_, seconds) in sorted(stacks.items())]
+
+    def summary(self) -> str:
+        """
+        Return a text table with the time spent per resource method and phase.
+
+        Returns:
+            str: one line per method followed by one line per phase.
+        """
+        with self.__lock:
+            stacks = dict(self.__stacks)
+            calls = dict(self.__calls)
+
+        phases = {}
+        for names, (_, seconds) in stacks.items():
+            if names[-1] not in calls:
+                method_phases = phases.setdefault(names[-2], {})
+                method_phases[names[-1]] = method_phases.get(names[-1], 0.0) + seconds
+
+        lines = ['{0:<52} {1:>8} {2:>12} {3:>10}'.format('method / phase', 'calls', 'total s', 'mean ms')]
+        for name, (count, seconds) in sorted(calls.items(), key=lambda item: -item[1][1]):
+            lines.append('{0:<52} {1:>8} {2:>12.4f} {3:>10.2f}'.format(name, count, seconds, seconds / count * 1e3))
+            for phase, phase_seconds in sorted(phases.get(name, {}).items(), key=lambda item: -item[1]):
+                share = phase_seconds / seconds * 100 if seconds else 0.0
+                lines.append('  {0:<50} {1:>8} {2:>12.4f} {3:>9.1f}%'.format(phase, '', phase_seconds, share))
+        return '\n'.join(lines)
+
+    def dump(self, output_path: str = None):
+        """
+        Write the results.
+
+        Args:
+            output_path (str, optional): path prefix of the '.folded' collapsed stack file and the '.txt'
+                summary. Defaults to None, printing the summary to stderr instead.
+        """
+        if output_path is None:
+            sys.stderr.write(self.summary() + '\n')
+            return
+        with open(output_path + '.folded', 'w') as folded_file:
+            folded_file.writelines(line + '\n' for line in self.collapsed_stacks())
+        with open(output_path + '.txt', 'w') as summary_file:
+            summary_file.write(self.summary() + '\n')
+
+    def reset(self):
+        with self.__lock:
+            self.__stacks = {}
+            self.__calls = {}
+
+    def _sample(self) -> bool:
+        return self.__sample_rate >= 1 or self.__random.random() < self.__sample_rate
+
+    def _record(self, names: Tuple[str, ...], seconds: float):
+        with self.__lock:
+            count, total = self.__stacks.get(names, (0, 0.0))
+            self.__stacks[names] = (count + 1, total + seconds)
+
+    def _record_call(self, frame: _Frame, seconds: float):
+        self._record(frame.names, max(0.0, seconds - frame.child_seconds))
+        name = frame.names[-1]
+        with self.__lock:
+            count, total = self.__calls.get(name, (0, 0.0))
+            self.__calls[name] = (count + 1, total + seconds)
+
+
+class _Call(object):
+    def __init__(self, profiler: Profiler, name: str):
+        self.__profiler = profiler
+        self.__name = name
+        self.__frame = None
+        self.__token = None
+        self.__started = None
+
+    def __enter__(self):
+        parent = _current_frame.get()
+        if parent is _UNSAMPLED or (parent is None and not self.__profiler._sample()):
+            self.__token = _current_frame.set(_UNSAMPLED)
+            return self
+
+        names = (parent.names if parent else ()) + (self.__name,)
+        self.__frame = _Frame(names, parent)
+        self.__token = _current_frame.set(self.__frame)
+        self.__started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _current_frame.reset(self.__token)
+        if self.__frame:
+            elapsed = time.perf_counter() - self.__started
+            if self.__frame.parent:
+                self.__frame.parent.child_seconds += elapsed
+            self.__profiler._record_call(self.__frame, elapsed)
+        return False
+
+
+def profiled(method: Callable) -> Callable:
+    """
+    Decorate a resource method so that its calls are timed when the config has a profiler.
+
+    Args:
+        method (Callable): a method of a [robo_ai.resources.client_resource.ClientResource] subclass.
+
+    Returns:
+        Callable: the wrapped method.
+    """
+    name = method.__qualname__
+
+    if asyncio.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            profiler = self.get_config().profiler
+            if profiler is None:
+                return await method(self, *args, **kwargs)
+            with profiler.call(name):
+                return await method(self, *args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = self.get_config().profiler
+        if profiler is None:
+            return method(self, *args, **kwargs)
+        with profiler.call(name):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def call(profiler: Profiler, name: str):
+    """
+    Return a context manager timing a call made outside the resources, or doing nothing without a profiler.
+
+    Args:
+        profiler (Profiler): the profiler of the config, may be None.
+        name (str): name of the call, e.g. 'RollingDeploy.update'.
+    """
+    if profiler is None:
+        return _NO_PHASE
+    return profiler.call(name)
+
+
+def phase(profiler: Profiler, name: str):
+    """
+    Return a context manager timing a phase of the running call, or doing nothing without a profiler.
+
+    Args:
+        profiler (Profiler): the profiler of the config, may be None.
+        name (str): name of the phase.
+    """
+    if profiler is None:
+        return _NO_PHASE
+    return profiler.phase(name)
+
+
+class PhaseTimedStream(object):
+    """
+    Wraps a request body stream so that reading it is timed as a phase.
+
+    Multipart encoders only encode and read the files while the transport consumes them, so without
+    this wrapper that time would be counted as 'network'.
+
+    Args:
+        stream: readable stream with a 'len' attribute, such as a MultipartEncoder.
+        profiler (Profiler): profiler of the config.
+        name (str): name of the phase.
+    """
+
+    def __init__(self, stream, profiler: Profiler, name: str):
+        self.__stream = stream
+        self.__profiler = profiler
+        self.__name = name
+
+    @property
+    def len(self) -> int:
+        return self.__stream.len
+
+    def read(self, size: int = -1) -> bytes:
+        with self.__profiler.phase(self.__name):
+            return self.__stream.read(size)
+
+    def __getattr__(self, name):
+        return getattr(self.__stream, name)
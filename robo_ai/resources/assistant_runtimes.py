@@ -1,8 +1,9 @@
 import os
-from typing import Callable
+from typing import BinaryIO, Callable
 
 from robo_ai.model.assistant_runtime.assistant_runtime_logs_response import AssistantRuntimeLogsResponse
 from robo_ai.model.assistant_runtime.assistant_runtime_response import AssistantRuntimeResponse
+from robo_ai.profiling.profiler import profiled
 from robo_ai.resources.client_resource import ClientResource, RequestMethod
 
 
@@ -11,6 +12,7 @@ class AssistantRuntimesResource(ClientResource):
     This class implements operations to manage bot runtimes.
     """
 
+    @profiled
     def create(
         self,
         assistant_uuid: str,
@@ -35,6 +37,7 @@ class AssistantRuntimesResource(ClientResource):
 
         return self.__deploy(RequestMethod.POST, assistant_uuid, package_file_path, base_runtime, progress_callback)
 
+    @profiled
     def update(
         self,
         assistant_uuid: str,
@@ -58,6 +61,7 @@ class AssistantRuntimesResource(ClientResource):
         """
         return self.__deploy(RequestMethod.PUT, assistant_uuid, package_file_path, base_runtime, progress_callback)
 
+    @profiled
     def stop(self, assistant_uuid: str):
         """
         Stop a bot runtime that is running.
@@ -71,6 +75,7 @@ class AssistantRuntimesResource(ClientResource):
         response = self.execute_request(RequestMethod.POST, url, response_class=AssistantRuntimeResponse)
         return response
 
+    @profiled
     def start(self, assistant_uuid: str):
         """
         Start a bot runtime that is stopped.
@@ -85,6 +90,7 @@ class AssistantRuntimesResource(ClientResource):
         response = self.execute_request(RequestMethod.POST, url, response_class=AssistantRuntimeResponse)
         return response
 
+    @profiled
     def remove(self, assistant_uuid: str):
         """
         Remove a bot runtime.
@@ -95,6 +101,7 @@ class AssistantRuntimesResource(ClientResource):
         url = self.__get_runtime_url(assistant_uuid)
         self.execute_request(RequestMethod.DELETE, url)
 
+    @profiled
     def get(self, assistant_uuid: str) -> AssistantRuntimeResponse:
         """
         Fetch information from a given bot runtime.
@@ -109,6 +116,22 @@ class AssistantRuntimesResource(ClientResource):
         response = self.execute_request(RequestMethod.GET, url, response_class=AssistantRuntimeResponse)
         return response
 
+    @profiled
+    async def get_async(self, assistant_uuid: str) -> AssistantRuntimeResponse:
+        """
+        Fetch information from a given bot runtime from a coroutine.
+
+        Args:
+            assistant_uuid (str): Unique identifier of the assistant runtime where the bot lives.
+
+        Returns:
+            AssistantRuntimeResponse: see [robo_ai.model.assistant_runtime.assistant_runtime_response]
+        """
+        url = self.__get_runtime_url(assistant_uuid)
+        response = await self.execute_request_async(RequestMethod.GET, url, response_class=AssistantRuntimeResponse)
+        return response
+
+    @profiled
     def get_logs(self, assistant_uuid: str) -> AssistantRuntimeLogsResponse:
         """
         Fetch the most recent logs from a given runtime.
@@ -147,24 +170,58 @@ class AssistantRuntimesResource(ClientResource):
         Returns:
             AssistantRuntimeResponse: see [robo_ai.model.assistant_runtime.assistant_runtime_response]
         """
-        url = self.__get_runtime_url(assistant_uuid)
         with open(package_file_path, "rb") as package_file:
-            data = {
-                "runtimeBase": base_runtime,
-                "file": (os.path.basename(package_file_path), package_file, "application/zip"),
-            }
+            return self._deploy_file(
+                method,
+                assistant_uuid,
+                os.path.basename(package_file_path),
+                package_file,
+                base_runtime,
+                progress_callback,
+            )
 
-            def progress_callback_wrapper(monitor):
-                progress_callback(monitor.bytes_read)
+    def _deploy_file(
+        self,
+        method: RequestMethod,
+        assistant_uuid: str,
+        file_name: str,
+        package_file: BinaryIO,
+        base_runtime: str,
+        progress_callback: Callable[[int], None] = None,
+    ) -> AssistantRuntimeResponse:
+        """
+        Deploy a bot from an already opened package file.
 
-            callback = None
-            if progress_callback:
-                callback = progress_callback_wrapper
+        Args:
+            method (RequestMethod): Method of the request to be executed.
+            assistant_uuid (str): Unique identifier of the assistant runtime where the bot lives.
+            file_name (str): Name under which the package is uploaded.
+            package_file (BinaryIO): Readable binary stream with the package contents.
+            base_runtime (str): Reference to the framework base and version where the bot was built,
+                in order to establish the correct environment in the server.
+            progress_callback (Callable[[int], None], optional): Callable object to enable a progress indicator
+                in the command line. Defaults to None.
 
-            response = self.execute_request(
-                method, url, data=data, response_class=AssistantRuntimeResponse, progress_callback=callback
-            )
-            return response
+        Returns:
+            AssistantRuntimeResponse: see [robo_ai.model.assistant_runtime.assistant_runtime_response]
+        """
+        url = self.__get_runtime_url(assistant_uuid)
+        data = {
+            "runtimeBase": base_runtime,
+            "file": (file_name, package_file, "application/zip"),
+        }
+
+        def progress_callback_wrapper(monitor):
+            progress_callback(monitor.bytes_read)
+
+        callback = None
+        if progress_callback:
+            callback = progress_callback_wrapper
+
+        response = self.execute_request(
+            method, url, data=data, response_class=AssistantRuntimeResponse, progress_callback=callback
+        )
+        return response
 
     @staticmethod
     def __get_runtime_url(assistant_uuid: str):
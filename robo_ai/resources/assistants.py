@@ -1,5 +1,6 @@
 from robo_ai.model.assistant.assistant_list_response import AssistantListResponse
 from robo_ai.model.assistant.assistant_response import AssistantResponse
+from robo_ai.profiling.profiler import profiled
 from robo_ai.resources.assistant_runtimes import AssistantRuntimesResource
 from robo_ai.resources.client_resource import ClientResource, RequestMethod
 
@@ -12,6 +13,7 @@ class AssistantsResource(ClientResource):
     def _register_resources(self):
         self._add_resource('runtimes', AssistantRuntimesResource)
 
+    @profiled
     def get_list(self, page=1) -> AssistantListResponse:
         """
         Return a paged list of all bots available.
@@ -26,6 +28,7 @@ class AssistantsResource(ClientResource):
         url = '/api/assistants'
         return self.execute_request(RequestMethod.GET, url, params=params, response_class=AssistantListResponse)
 
+    @profiled
     def get_assistant(self, uuid: str) -> AssistantResponse:
         """
         Return an assistant according to a given uuid.
@@ -3,7 +3,6 @@ from typing import Optional, BinaryIO, Type, Union, Callable
 from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
 
 import cattr
-import requests
 
 from robo_ai.exception.api_error import ApiError
 from robo_ai.exception.invalid_credentials_error import InvalidCredentialsError
@@ -12,6 +11,7 @@ from robo_ai.exception.not_found_error import NotFoundError
 from robo_ai.model.base_response import BaseResponse
 from robo_ai.model.config import Config
 from robo_ai.model.session import Session
+from robo_ai.profiling.profiler import PhaseTimedStream, phase
 
 
 class RequestMethod(Enum):
@@ -112,32 +112,63 @@ class ClientResource:
                 If the request is not successful, an Exception is raised.
         """
 
+        config = self.get_config()
+        full_url, headers, data_fields = self.__prepare_request(url, data, headers, auth_headers, progress_callback)
+        with phase(config.profiler, 'network'):
+            response = config.transport.send(method.value, full_url, headers=headers, params=params,
+                                             data=data_fields, json_data=json_data, files=files)
+        return self.__handle_response(response, response_class)
+
+    async def execute_request_async(self, method: RequestMethod, url: str, response_class: Type[BaseResponse] = None,
+                                    json_data: dict = None, data: Union[dict, BinaryIO] = None, files: dict = None,
+                                    params: dict = None, headers: dict = {}, auth_headers=True,
+                                    progress_callback: Callable[[MultipartEncoderMonitor], None] = None):
+        """
+        Execute request from a coroutine.
+
+        Takes the same arguments, raises the same errors and returns the same values as execute_request.
+        The request is sent with the transport's send_async method.
+        """
+        config = self.get_config()
+        full_url, headers, data_fields = self.__prepare_request(url, data, headers, auth_headers, progress_callback)
+        with phase(config.profiler, 'network'):
+            response = await config.transport.send_async(method.value, full_url, headers=headers, params=params,
+                                                         data=data_fields, json_data=json_data, files=files)
+        return self.__handle_response(response, response_class)
+
+    def __prepare_request(self, url: str, data: Union[dict, BinaryIO], headers: dict, auth_headers: bool,
+                          progress_callback: Callable[[MultipartEncoderMonitor], None]):
         config = self.get_config()
         full_url = config.base_endpoint + url
+        headers = dict(headers)
 
         if auth_headers:
-            auth_headers = self.get_auth_headers()
-            headers = {
-                **headers,
-                **auth_headers
-            }
+            with phase(config.profiler, 'auth'):
+                headers.update(self.get_auth_headers())
 
         data_fields = None
         if data:
-            data_fields = MultipartEncoder(fields=data)
-            headers['Content-Type'] = data_fields.content_type
-            if progress_callback:
-                data_fields = MultipartEncoderMonitor(data_fields, progress_callback)
+            with phase(config.profiler, 'encode'):
+                data_fields = MultipartEncoder(fields=data)
+                headers['Content-Type'] = data_fields.content_type
+                if progress_callback:
+                    data_fields = MultipartEncoderMonitor(data_fields, progress_callback)
+            if config.profiler:
+                data_fields = PhaseTimedStream(data_fields, config.profiler, 'encode')
 
-        response = requests.request(method.value, full_url, headers=headers, params=params, data=data_fields,
-                                    json=json_data, files=files)
+        return full_url, headers, data_fields
 
+    def __handle_response(self, response, response_class: Type[BaseResponse]):
         # all 2xx codes are considered success
         is_success = response.status_code // 100 == 2
 
         if is_success:
             if response_class:
-                assistant = cattr.structure(response.json(), response_class)
+                profiler = self.get_config().profiler
+                with phase(profiler, 'json'):
+                    response_data = response.json()
+                with phase(profiler, 'structure'):
+                    assistant = cattr.structure(response_data, response_class)
                 return assistant
             else:
                 return response.content
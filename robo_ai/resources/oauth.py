@@ -1,11 +1,11 @@
 import requests
-from requests.auth import HTTPBasicAuth
 
 from robo_ai.exception.api_error import ApiError
 from robo_ai.exception.invalid_credentials_error import InvalidCredentialsError
 from robo_ai.exception.invalid_token_error import InvalidTokenError
 from robo_ai.model.auth.access_info import AccessInfo
 from robo_ai.model.auth.access_token import AccessToken
+from robo_ai.profiling.profiler import phase, profiled
 from robo_ai.resources.client_resource import ClientResource
 
 
@@ -14,10 +14,14 @@ class OauthResource(ClientResource):
     Authentication manager.
     """
 
+    @profiled
     def authenticate(self, api_key: str) -> AccessToken:
         """
         Initiate a new session.
 
+        If the config has a token store, a cached token that is still valid is returned
+        instead of requesting a new one.
+
         Args:
             api_key (str): a string containing the API key
 
@@ -29,19 +33,29 @@ class OauthResource(ClientResource):
             AccessToken: Contains the 'access_token', 'token_type', 'expires_in' and 'scope' fields.
                 See [robo_ai.model.auth.access_token.AccessToken]
         """
+        config = self.get_config()
+        token_store = config.token_store
+        if token_store:
+            key = token_store.make_key(config.base_endpoint, api_key)
+            return token_store.get_token(key, lambda: self.__request_token(api_key))
+        return self.__request_token(api_key)
+
+    def __request_token(self, api_key: str) -> AccessToken:
         config = self.get_config()
         data = {
             'grant_type': 'client_credentials',
             'apiKey': api_key,
         }
-        auth = HTTPBasicAuth(
+        auth = (
             config.http_auth_username,
             config.http_auth_password
         )
         endpoint = config.base_endpoint + '/oauth/token'
-        response = requests.post(endpoint, data=data, auth=auth)
+        with phase(config.profiler, 'network'):
+            response = config.transport.send('post', endpoint, data=data, auth=auth)
         if response.status_code == requests.codes.ok:
-            tokens = response.json()
+            with phase(config.profiler, 'json'):
+                tokens = response.json()
             return AccessToken(
                 tokens['access_token'],
                 tokens['token_type'],
@@ -53,6 +67,7 @@ class OauthResource(ClientResource):
         else:
             raise ApiError()
 
+    @profiled
     def get_token_info(self, token: str) -> AccessInfo:
         """
         Return the token information
@@ -69,7 +84,7 @@ class OauthResource(ClientResource):
                 See [robo_ai.model.auth.access_info.AccessInfo].
         """
         config = self.get_config()
-        auth = HTTPBasicAuth(
+        auth = (
             config.http_auth_username,
             config.http_auth_password
         )
@@ -77,9 +92,11 @@ class OauthResource(ClientResource):
             'token': token,
         }
         endpoint = config.base_endpoint + '/oauth/check_token/'
-        response = requests.post(endpoint, data=data, auth=auth)
+        with phase(config.profiler, 'network'):
+            response = config.transport.send('post', endpoint, data=data, auth=auth)
         if response.status_code == requests.codes.ok:
-            info_dict = response.json()
+            with phase(config.profiler, 'json'):
+                info_dict = response.json()
             return AccessInfo(
                 info_dict['active'],
                 info_dict['exp'],
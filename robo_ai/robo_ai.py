@@ -1,5 +1,9 @@
+import atexit
+import functools
+
 from robo_ai.model.session import Session
 from robo_ai.model.config import Config
+from robo_ai.profiling.profiler import Profiler
 from robo_ai.resources.assistants import AssistantsResource
 from robo_ai.resources.base_resource import BaseResource
 from robo_ai.resources.oauth import OauthResource
@@ -22,6 +26,7 @@ class RoboAi:
     __config: Config = None
     __base_resource: BaseResource = None
     __current_session = Session()
+    __profiler_dump = None
 
     def __init__(self, config: Config):
         self.__config = config
@@ -45,6 +50,34 @@ class RoboAi:
         """
         self.__current_session.access_token = access_token
 
+    def enable_profiling(self, sample_rate: float = 1.0, output_path: str = None) -> Profiler:
+        """
+        Time every phase of the calls made through the resources, reporting the results when the process exits.
+
+        Calling it again replaces the previous profiler, whose timings are then not reported.
+
+        Args:
+            sample_rate (float, optional): fraction of the calls that are timed. Defaults to 1.
+            output_path (str, optional): path prefix of the '.folded' collapsed stack file, readable by
+                flame graph tools, and of the '.txt' summary. Defaults to None, printing the summary to stderr.
+
+        Returns:
+            Profiler: object holding the timings, see [robo_ai.profiling.profiler.Profiler]
+        """
+        profiler = Profiler(sample_rate)
+        self.__config.profiler = profiler
+        if self.__profiler_dump:
+            atexit.unregister(self.__profiler_dump)
+        self.__profiler_dump = functools.partial(profiler.dump, output_path)
+        atexit.register(self.__profiler_dump)
+        return profiler
+
+    def disable_profiling(self):
+        """
+        Stop timing calls. Timings already collected are still reported when the process exits.
+        """
+        self.__config.profiler = None
+
     @property
     def oauth(self) -> OauthResource:
         """
@@ -0,0 +1,91 @@
+import json
+import os
+import threading
+from typing import Callable
+
+from robo_ai.model.auth.access_token import AccessToken
+from robo_ai.token_store.token_store import TokenStore
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class FileTokenStore(TokenStore):
+    """
+    Token store shared by every process that points to the same file.
+
+    Cached tokens are read without locking. Refreshing takes an exclusive lock on a side file,
+    so when many processes find the token expired only the first one requests a new token and
+    the others reuse it.
+
+    Args:
+        path (str): file where the tokens are kept. It is created with owner-only permissions.
+        leeway (int, optional): seconds before expiration at which a token is already refreshed. Defaults to 60.
+    """
+
+    def __init__(self, path: str, leeway: int = 60):
+        super().__init__(leeway)
+        self.__path = path
+        self.__lock_path = path + '.lock'
+        self.__pid = os.getpid()
+        self.__thread_lock = threading.Lock()
+
+    def get_token(self, key: str, fetch: Callable[[], AccessToken]) -> AccessToken:
+        token = self._from_record(self.__read().get(key))
+        if token:
+            return token
+
+        if self.__pid != os.getpid():
+            # the lock may have been held by another thread of the parent when forking
+            self.__pid = os.getpid()
+            self.__thread_lock = threading.Lock()
+
+        with self.__thread_lock, _FileLock(self.__lock_path):
+            records = self.__read()
+            token = self._from_record(records.get(key))
+            if token:
+                return token
+            token = fetch()
+            records[key] = self._to_record(token)
+            self.__write(records)
+            return token
+
+    def __read(self) -> dict:
+        try:
+            with open(self.__path, 'r') as store_file:
+                return json.load(store_file)
+        except (OSError, ValueError):
+            return {}
+
+    def __write(self, records: dict):
+        temp_path = '{0}.{1}.tmp'.format(self.__path, os.getpid())
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as store_file:
+            json.dump(records, store_file)
+        os.replace(temp_path, self.__path)
+
+
+class _FileLock(object):
+    def __init__(self, path: str):
+        self.__path = path
+        self.__fd = None
+
+    def __enter__(self):
+        self.__fd = os.open(self.__path, os.O_RDWR | os.O_CREAT, 0o600)
+        if fcntl:
+            fcntl.flock(self.__fd, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(self.__fd, msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if fcntl:
+                fcntl.flock(self.__fd, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(self.__fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self.__fd)
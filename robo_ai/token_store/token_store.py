@@ -0,0 +1,91 @@
+import hashlib
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from robo_ai.model.auth.access_token import AccessToken
+
+
+class TokenStore(object):
+    """
+    Cache of access tokens shared by every client that uses it.
+
+    Args:
+        leeway (int, optional): seconds before expiration at which a token is already refreshed. Defaults to 60.
+    """
+
+    def __init__(self, leeway: int = 60):
+        self.__leeway = leeway
+
+    def get_token(self, key: str, fetch: Callable[[], AccessToken]) -> AccessToken:
+        """
+        Return a valid token for a key, calling fetch only if none is cached.
+
+        Args:
+            key (str): identifies the credentials the token belongs to.
+            fetch (Callable[[], AccessToken]): obtains a new token from the server.
+
+        Returns:
+            AccessToken: see [robo_ai.model.auth.access_token.AccessToken]
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def make_key(base_endpoint: str, api_key: str) -> str:
+        """
+        Return a store key for a set of credentials without exposing the API key.
+
+        Args:
+            base_endpoint (str): URL of the server.
+            api_key (str): a string containing the API key.
+
+        Returns:
+            str: a SHA-256 digest of the endpoint and API key.
+        """
+        return hashlib.sha256('{0}\n{1}'.format(base_endpoint, api_key).encode('utf-8')).hexdigest()
+
+    def _to_record(self, token: AccessToken) -> dict:
+        return {
+            'access_token': token.access_token,
+            'token_type': token.token_type,
+            'expires_at': time.time() + (token.expires_in or 0),
+            'scope': token.scope,
+        }
+
+    def _from_record(self, record: Optional[dict]) -> Optional[AccessToken]:
+        if not record:
+            return None
+        expires_in = int(record['expires_at'] - time.time())
+        if expires_in <= self.__leeway:
+            return None
+        return AccessToken(record['access_token'], record['token_type'], expires_in, record['scope'])
+
+
+class MemoryTokenStore(TokenStore):
+    """
+    Token store shared by the threads of a single process.
+    """
+
+    def __init__(self, leeway: int = 60):
+        super().__init__(leeway)
+        self.__records = {}
+        self.__pid = os.getpid()
+        self.__lock = threading.Lock()
+
+    def get_token(self, key: str, fetch: Callable[[], AccessToken]) -> AccessToken:
+        if self.__pid != os.getpid():
+            # the lock may have been held by another thread of the parent when forking
+            self.__pid = os.getpid()
+            self.__lock = threading.Lock()
+
+        token = self._from_record(self.__records.get(key))
+        if token:
+            return token
+        with self.__lock:
+            token = self._from_record(self.__records.get(key))
+            if token:
+                return token
+            token = fetch()
+            self.__records[key] = self._to_record(token)
+            return token
@@ -0,0 +1,130 @@
+import base64
+import gzip
+import json
+import threading
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import attr
+
+# replaces the tokens returned by the OAuth endpoints, so that replayed sessions still get a token
+REDACTED_TOKEN = 'redacted-token'
+_TOKEN_FIELDS = ('access_token', 'refresh_token')
+
+
+@attr.s(auto_attribs=True)
+class CassetteEntry(object):
+    method: str = None
+    path: str = None
+    query: List[Tuple[str, str]] = attr.Factory(list)
+    status_code: int = None
+    content_type: str = None
+    body: str = None
+    elapsed: float = None
+
+
+def request_key(method: str, url: str, params: dict = None) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+    """
+    Return the key used to match a request against the recorded ones.
+
+    The host is left out so that a cassette can be replayed against any base endpoint.
+
+    Args:
+        method (str): HTTP method.
+        url (str): full URL of the request.
+        params (dict, optional): query string parameters. Defaults to None.
+
+    Returns:
+        Tuple: the upper case method, the URL path and the sorted query string pairs.
+    """
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query)
+    if params:
+        query.extend((str(name), str(value)) for name, value in params.items())
+    return method.upper(), parts.path, tuple(sorted(query))
+
+
+class Cassette(object):
+    """
+    Request/response pairs stored as gzip compressed JSON lines.
+
+    Request bodies and headers are never stored and the tokens in the responses of the
+    OAuth endpoints are replaced by [robo_ai.transport.cassette.REDACTED_TOKEN], so uploaded
+    packages, API keys and bearer tokens do not end up on disk.
+
+    Args:
+        entries (List[CassetteEntry], optional): initial entries. Defaults to None.
+    """
+
+    def __init__(self, entries: List[CassetteEntry] = None):
+        self.__entries = list(entries or [])
+        self.__lock = threading.Lock()
+
+    @property
+    def entries(self) -> List[CassetteEntry]:
+        return list(self.__entries)
+
+    def append(self, entry: CassetteEntry):
+        with self.__lock:
+            self.__entries.append(entry)
+
+    def by_key(self) -> Dict[tuple, List[CassetteEntry]]:
+        """
+        Group the entries by request key, keeping the recording order.
+
+        Returns:
+            Dict[tuple, List[CassetteEntry]]: entries indexed by [robo_ai.transport.cassette.request_key].
+        """
+        grouped = {}
+        for entry in self.entries:
+            key = (entry.method, entry.path, tuple(sorted(tuple(pair) for pair in entry.query)))
+            grouped.setdefault(key, []).append(entry)
+        return grouped
+
+    def save(self, path: str):
+        with gzip.open(path, 'wt', encoding='utf-8') as cassette_file:
+            for entry in self.entries:
+                cassette_file.write(json.dumps(attr.asdict(entry), separators=(',', ':')))
+                cassette_file.write('\n')
+
+    @classmethod
+    def load(cls, path: str) -> 'Cassette':
+        entries = []
+        with gzip.open(path, 'rt', encoding='utf-8') as cassette_file:
+            for line in cassette_file:
+                if line.strip():
+                    entries.append(CassetteEntry(**json.loads(line)))
+        return cls(entries)
+
+    @staticmethod
+    def encode_body(content: bytes) -> str:
+        return base64.b64encode(content).decode('ascii')
+
+    @staticmethod
+    def redact_body(path: str, content: bytes) -> bytes:
+        """
+        Replace the tokens found in the body of an OAuth response.
+
+        Args:
+            path (str): URL path of the request.
+            content (bytes): raw response body.
+
+        Returns:
+            bytes: the body without tokens, or the original body if it has none.
+        """
+        if not path.startswith('/oauth/') or not content:
+            return content
+        try:
+            fields = json.loads(content)
+        except ValueError:
+            return content
+        if not isinstance(fields, dict) or not any(name in fields for name in _TOKEN_FIELDS):
+            return content
+        for name in _TOKEN_FIELDS:
+            if name in fields:
+                fields[name] = REDACTED_TOKEN
+        return json.dumps(fields).encode('utf-8')
+
+    @staticmethod
+    def decode_body(body: str) -> bytes:
+        return base64.b64decode(body) if body else b''
@@ -0,0 +1,164 @@
+import asyncio
+import os
+import threading
+import warnings
+import weakref
+from typing import Any, Callable, Tuple
+
+from robo_ai.transport.requests_transport import RequestsTransport
+from robo_ai.transport.transport import Transport
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+except ImportError:
+    h2 = None
+
+
+class Http2Transport(Transport):
+    """
+    Transport multiplexing concurrent requests over a few HTTP/2 connections.
+
+    It needs the optional httpx[http2] dependency. HTTP/2 is negotiated with the server on HTTPS
+    connections, falling back to HTTP/1.1 when the server does not support it. Without the h2
+    package requests are sent over HTTP/1.1 with httpx, and without httpx the transport delegates
+    to a [robo_ai.transport.requests_transport.RequestsTransport].
+
+    Args:
+        max_connections (int, optional): maximum number of connections kept open. Defaults to 10.
+        prior_knowledge (bool, optional): speak HTTP/2 without negotiation, which allows plain text
+            HTTP/2 servers. Only use it with servers known to support HTTP/2. Defaults to False.
+        timeout (float, optional): seconds to wait for the server. Defaults to None, meaning no timeout.
+    """
+
+    def __init__(self, max_connections: int = 10, prior_knowledge: bool = False, timeout: float = None):
+        self.__max_connections = max_connections
+        self.__prior_knowledge = prior_knowledge
+        self.__timeout = timeout
+        self.__fallback = None
+        self.__pid = os.getpid()
+        self.__lock = threading.Lock()
+        self.__client = None
+        self.__async_clients = weakref.WeakKeyDictionary()
+
+        if httpx is None:
+            warnings.warn('httpx is not installed, Http2Transport falls back to HTTP/1.1 with requests')
+            self.__fallback = RequestsTransport(pool_maxsize=max_connections)
+        elif h2 is None:
+            warnings.warn('h2 is not installed, Http2Transport falls back to HTTP/1.1')
+
+    @property
+    def http2(self) -> bool:
+        return httpx is not None and h2 is not None
+
+    def send(self, method: str, url: str, headers: dict = None, params: dict = None, data: Any = None,
+             json_data: dict = None, files: dict = None, auth: Tuple[str, str] = None):
+        if self.__fallback:
+            return self.__fallback.send(method, url, headers=headers, params=params, data=data,
+                                        json_data=json_data, files=files, auth=auth)
+        args = self.__request_args(headers, params, data, json_data, files, auth, _read_chunks)
+        return self.__get_client().request(method, url, **args)
+
+    async def send_async(self, method: str, url: str, headers: dict = None, params: dict = None, data: Any = None,
+                         json_data: dict = None, files: dict = None, auth: Tuple[str, str] = None):
+        if self.__fallback:
+            return await self.__fallback.send_async(method, url, headers=headers, params=params, data=data,
+                                                    json_data=json_data, files=files, auth=auth)
+        args = self.__request_args(headers, params, data, json_data, files, auth, _read_chunks_async)
+        return await self.__get_async_client().request(method, url, **args)
+
+    def close(self):
+        """
+        Close the connections of the synchronous client.
+        """
+        with self.__lock:
+            if self.__client:
+                self.__client.close()
+                self.__client = None
+
+    async def aclose(self):
+        """
+        Close the connections opened from the running event loop.
+        """
+        client = self.__async_clients.pop(asyncio.get_event_loop(), None)
+        if client:
+            await client.aclose()
+
+    def __client_args(self) -> dict:
+        return {
+            'http1': not (self.__prior_knowledge and self.http2),
+            'http2': self.http2,
+            'limits': httpx.Limits(max_connections=self.__max_connections),
+            'timeout': self.__timeout,
+        }
+
+    def __check_fork(self):
+        if self.__pid != os.getpid():
+            # connections inherited from the parent process must not be reused
+            self.__pid = os.getpid()
+            self.__lock = threading.Lock()
+            self.__client = None
+            self.__async_clients = weakref.WeakKeyDictionary()
+
+    def __get_client(self):
+        self.__check_fork()
+        client = self.__client
+        if client is None:
+            with self.__lock:
+                if self.__client is None:
+                    self.__client = httpx.Client(**self.__client_args())
+                client = self.__client
+        return client
+
+    def __get_async_client(self):
+        # an async client is bound to the event loop that created it
+        self.__check_fork()
+        loop = asyncio.get_event_loop()
+        client = self.__async_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(**self.__client_args())
+            self.__async_clients[loop] = client
+        return client
+
+    @staticmethod
+    def __request_args(headers: dict, params: dict, data: Any, json_data: dict, files: dict,
+                       auth: Tuple[str, str], read_chunks: Callable) -> dict:
+        args = {
+            'headers': headers,
+            'params': params,
+            'json': json_data,
+            'files': files,
+            'auth': _basic_auth(auth),
+        }
+        if isinstance(data, dict):
+            args['data'] = data
+        elif data is not None:
+            # streaming bodies such as a MultipartEncoder are sent in chunks
+            args['content'] = read_chunks(data)
+            if hasattr(data, 'len'):
+                args['headers'] = {**(headers or {}), 'Content-Length': str(data.len)}
+        return args
+
+
+def _basic_auth(auth: Tuple[str, str]):
+    # the config may have no HTTP credentials, which requests accepts but httpx does not
+    if not auth or all(part is None for part in auth):
+        return None
+    return tuple('' if part is None else part for part in auth)
+
+
+def _read_chunks(stream, chunk_size: int = 64 * 1024):
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _read_chunks_async(stream, chunk_size: int = 64 * 1024):
+    for chunk in _read_chunks(stream, chunk_size):
+        yield chunk
@@ -0,0 +1,51 @@
+import time
+from typing import Any, Tuple
+
+from robo_ai.transport.cassette import Cassette, CassetteEntry, request_key
+from robo_ai.transport.requests_transport import RequestsTransport
+from robo_ai.transport.transport import Transport
+
+
+class RecordingTransport(Transport):
+    """
+    Transport that forwards requests to another transport and records every response.
+
+    Args:
+        cassette_path (str): file where the cassette is written by save().
+        transport (Transport, optional): transport that actually sends the requests.
+            Defaults to a RequestsTransport.
+    """
+
+    def __init__(self, cassette_path: str, transport: Transport = None):
+        self.__cassette_path = cassette_path
+        self.__transport = transport or RequestsTransport()
+        self.__cassette = Cassette()
+
+    @property
+    def cassette(self) -> Cassette:
+        return self.__cassette
+
+    def send(self, method: str, url: str, headers: dict = None, params: dict = None, data: Any = None,
+             json_data: dict = None, files: dict = None, auth: Tuple[str, str] = None):
+        started = time.monotonic()
+        response = self.__transport.send(method, url, headers=headers, params=params, data=data,
+                                         json_data=json_data, files=files, auth=auth)
+        elapsed = time.monotonic() - started
+
+        method, path, query = request_key(method, url, params)
+        self.__cassette.append(CassetteEntry(
+            method=method,
+            path=path,
+            query=list(query),
+            status_code=response.status_code,
+            content_type=response.headers.get('Content-Type'),
+            body=Cassette.encode_body(Cassette.redact_body(path, response.content)),
+            elapsed=elapsed,
+        ))
+        return response
+
+    def save(self):
+        """
+        Write the recorded requests to the cassette file.
+        """
+        self.__cassette.save(self.__cassette_path)
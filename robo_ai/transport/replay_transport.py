@@ -0,0 +1,78 @@
+import random
+import threading
+import time
+from typing import Any, Tuple
+
+from robo_ai.transport.cassette import Cassette, request_key
+from robo_ai.transport.transport import Transport
+from robo_ai.transport.transport_response import TransportResponse
+
+
+class ReplayTransport(Transport):
+    """
+    Transport that answers requests from a recorded cassette without touching the network.
+
+    Requests are matched by method, path and query string. When the same request was recorded
+    several times, the responses are replayed in recording order and then start over.
+
+    Args:
+        cassette_path (str): cassette written by a [robo_ai.transport.recording_transport.RecordingTransport].
+        latency (float, optional): seconds added to every response. Defaults to 0.
+        jitter (float, optional): maximum random seconds added on top of the latency. Defaults to 0.
+        recorded_latency (bool, optional): also wait for the time the response originally took. Defaults to False.
+        error_rate (float, optional): probability of answering with error_status instead of the
+            recorded response. Defaults to 0.
+        error_status (int, optional): status code of the injected errors. Defaults to 503.
+        max_concurrency (int, optional): maximum number of requests served at the same time,
+            further requests wait for a free slot. Defaults to None, meaning unlimited.
+        seed (int, optional): seed of the jitter and error injection, for repeatable runs. Defaults to None.
+
+    Raises:
+        LookupError: from send() if the request is not in the cassette.
+    """
+
+    def __init__(self, cassette_path: str, latency: float = 0.0, jitter: float = 0.0,
+                 recorded_latency: bool = False, error_rate: float = 0.0, error_status: int = 503,
+                 max_concurrency: int = None, seed: int = None):
+        self.__responses = Cassette.load(cassette_path).by_key()
+        self.__cursors = dict.fromkeys(self.__responses, 0)
+        self.__latency = latency
+        self.__jitter = jitter
+        self.__recorded_latency = recorded_latency
+        self.__error_rate = error_rate
+        self.__error_status = error_status
+        self.__slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+
+    def send(self, method: str, url: str, headers: dict = None, params: dict = None, data: Any = None,
+             json_data: dict = None, files: dict = None, auth: Tuple[str, str] = None) -> TransportResponse:
+        key = request_key(method, url, params)
+        entries = self.__responses.get(key)
+        if not entries:
+            raise LookupError('No recorded response for {0} {1}'.format(key[0], url))
+
+        with self.__lock:
+            entry = entries[self.__cursors[key] % len(entries)]
+            self.__cursors[key] += 1
+            delay = self.__latency + self.__random.uniform(0, self.__jitter)
+            inject_error = self.__random.random() < self.__error_rate
+
+        if self.__recorded_latency and entry.elapsed:
+            delay += entry.elapsed
+
+        if self.__slots:
+            with self.__slots:
+                self.__wait(delay)
+        else:
+            self.__wait(delay)
+
+        if inject_error:
+            return TransportResponse(self.__error_status, b'')
+        headers = {'Content-Type': entry.content_type} if entry.content_type else {}
+        return TransportResponse(entry.status_code, Cassette.decode_body(entry.body), headers)
+
+    @staticmethod
+    def __wait(delay: float):
+        if delay > 0:
+            time.sleep(delay)
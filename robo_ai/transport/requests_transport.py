@@ -0,0 +1,45 @@
+import os
+import threading
+from typing import Any, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from robo_ai.transport.transport import Transport
+
+
+class RequestsTransport(Transport):
+    """
+    Default transport, sending requests over the network with the requests library.
+
+    Each thread keeps its own pooled session. The pools are discarded in a process created with
+    fork, so the child never writes to sockets it inherited from its parent.
+
+    Args:
+        pool_maxsize (int, optional): maximum number of connections kept per host. Defaults to 10.
+    """
+
+    def __init__(self, pool_maxsize: int = 10):
+        self.__pool_maxsize = pool_maxsize
+        self.__pid = os.getpid()
+        self.__local = threading.local()
+
+    def send(self, method: str, url: str, headers: dict = None, params: dict = None, data: Any = None,
+             json_data: dict = None, files: dict = None, auth: Tuple[str, str] = None) -> requests.Response:
+        return self.__get_session().request(method, url, headers=headers, params=params, data=data,
+                                            json=json_data, files=files, auth=auth)
+
+    def __get_session(self) -> requests.Session:
+        pid = os.getpid()
+        if pid != self.__pid:
+            self.__pid = pid
+            self.__local = threading.local()
+
+        session = getattr(self.__local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=self.__pool_maxsize)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self.__local.session = session
+        return session
@@ -0,0 +1,44 @@
+import asyncio
+import functools
+from typing import Any, Tuple
+
+
+class Transport(object):
+    """
+    Sends the HTTP requests issued by the resources.
+
+    Subclasses can replace the network layer, e.g. to record or replay traffic.
+    """
+
+    def send(self, method: str, url: str, headers: dict = None, params: dict = None, data: Any = None,
+             json_data: dict = None, files: dict = None, auth: Tuple[str, str] = None):
+        """
+        Send a request.
+
+        Args:
+            method (str): HTTP method in lower case.
+            url (str): full URL of the request.
+            headers (dict, optional): request headers. Defaults to None.
+            params (dict, optional): query string parameters. Defaults to None.
+            data (Any, optional): form fields or a streaming body such as a MultipartEncoder. Defaults to None.
+            json_data (dict, optional): payload to be sent as JSON. Defaults to None.
+            files (dict, optional): files to be sent as multipart. Defaults to None.
+            auth (Tuple[str, str], optional): username and password for basic authentication. Defaults to None.
+
+        Returns:
+            an object with the 'status_code' and 'content' attributes and a 'json()' method,
+                such as requests.Response or TransportResponse.
+        """
+        raise NotImplementedError()
+
+    async def send_async(self, method: str, url: str, headers: dict = None, params: dict = None, data: Any = None,
+                         json_data: dict = None, files: dict = None, auth: Tuple[str, str] = None):
+        """
+        Send a request from a coroutine.
+
+        Takes the same arguments and returns the same values as send. By default send is run
+        in the event loop's executor; transports with native async support override it.
+        """
+        call = functools.partial(self.send, method, url, headers=headers, params=params, data=data,
+                                 json_data=json_data, files=files, auth=auth)
+        return await asyncio.get_event_loop().run_in_executor(None, call)
@@ -0,0 +1,26 @@
+import json
+
+
+class TransportResponse(object):
+    """
+    Minimal HTTP response returned by transports that do not go through requests.
+
+    It exposes the subset of the requests.Response interface used by the resources.
+
+    Args:
+        status_code (int): HTTP status code.
+        content (bytes): raw response body.
+        headers (dict, optional): response headers. Defaults to None.
+    """
+
+    def __init__(self, status_code: int, content: bytes, headers: dict = None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8')
+
+    def json(self):
+        return json.loads(self.content)
@@ -15,7 +15,15 @@ setup(
     packages=setuptools.find_packages(),
     setup_requires=['attrs', 'cattrs', 'requests'],
     install_requires=['attrs', 'cattrs', 'requests'],
-    python_requires=">=3.6",
+    extras_require={
+        'http2': ['httpx[http2]'],
+    },
+    python_requires=">=3.7",
+    entry_points={
+        'console_scripts': [
+            'robo-ai=robo_ai.cli:main',
+        ],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "Operating System :: OS Independent",
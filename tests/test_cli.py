@@ -0,0 +1,76 @@
+import threading
+
+import pytest
+
+from robo_ai.cli import JsonLinesWriter, new_log_lines, run_parallel
+from robo_ai.exception.not_found_error import NotFoundError
+
+
+class ListStream(object):
+    def __init__(self, fail_after=None):
+        self.lines = []
+        self.fail_after = fail_after
+
+    def write(self, text):
+        if self.fail_after is not None and len(self.lines) >= self.fail_after:
+            raise BrokenPipeError()
+        self.lines.append(text)
+
+    def flush(self):
+        pass
+
+
+@pytest.mark.parametrize('previous, current, expected', [
+    ([], ['a', 'b'], ['a', 'b']),
+    (['a', 'b', 'c'], ['b', 'c', 'd', 'e'], ['d', 'e']),
+    (['a', 'b'], ['a', 'b'], []),
+    (['a', 'b'], ['x', 'y'], ['x', 'y']),
+    (['a', 'b', 'a'], ['a', 'b', 'a', 'c'], ['c']),
+])
+def test_new_log_lines(previous, current, expected):
+    assert new_log_lines(previous, current) == expected
+
+
+def test_run_parallel_writes_results_and_errors():
+    def call(item):
+        if item == 'missing':
+            raise NotFoundError()
+        return {'id': item}
+
+    stream = ListStream()
+    writer = JsonLinesWriter(stream)
+    run_parallel(['a', 'missing', 'b'], call, writer, concurrency=2)
+
+    assert writer.errors == 1
+    assert len(stream.lines) == 3
+
+
+def test_run_parallel_unexpected_error_fails_only_its_item():
+    def call(item):
+        if item == 2:
+            raise ValueError('malformed response')
+        return item
+
+    stream = ListStream()
+    writer = JsonLinesWriter(stream)
+    run_parallel([1, 2, 3, 4, 5], call, writer, concurrency=1)
+
+    assert writer.errors == 1
+    assert len(stream.lines) == 5
+    assert '"error":"ValueError","message":"malformed response"' in stream.lines[1]
+
+
+def test_run_parallel_stops_submitting_after_broken_pipe():
+    calls = []
+    lock = threading.Lock()
+
+    def call(item):
+        with lock:
+            calls.append(item)
+        return item
+
+    writer = JsonLinesWriter(ListStream(fail_after=1))
+    with pytest.raises(BrokenPipeError):
+        run_parallel(range(200), call, writer, concurrency=4)
+
+    assert len(calls) <= 4 + 1
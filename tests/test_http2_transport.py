@@ -0,0 +1,162 @@
+import asyncio
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from robo_ai.exception.not_found_error import NotFoundError
+from robo_ai.model.assistant_runtime.assistant_runtime_status import AssistantRuntimeStatus
+from robo_ai.model.config import Config
+from robo_ai.robo_ai import RoboAi
+from robo_ai.transport import http2_transport
+from robo_ai.transport.http2_transport import Http2Transport
+from robo_ai.transport.requests_transport import RequestsTransport
+
+pytest.importorskip('httpx')
+
+NO_AUTH = {'username': None, 'password': None}
+TOKEN = {'access_token': 'token', 'token_type': 'bearer', 'expires_in': 3600, 'scope': 'all'}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.answer()
+
+    def do_POST(self):
+        self.answer()
+
+    def do_PUT(self):
+        self.answer()
+
+    def answer(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        self.server.received.append({
+            'method': self.command,
+            'path': self.path,
+            'headers': dict(self.headers),
+            'body': body,
+            'port': self.client_address[1],
+        })
+        if self.path == '/oauth/token':
+            self.reply(200, TOKEN)
+        elif self.path.startswith('/api/assistants/missing/'):
+            self.reply(404, {})
+        else:
+            self.reply(200, {'content': {'assistantUuid': 'a', 'status': 'RUNNING'}})
+
+    def reply(self, status, document):
+        payload = json.dumps(document).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    httpd.received = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def make_robo(server, transport):
+    return RoboAi(Config('http://127.0.0.1:{0}'.format(server.server_address[1]), NO_AUTH, transport=transport))
+
+
+def test_sync_requests_are_handled_like_requests(server):
+    transport = Http2Transport()
+    robo = make_robo(server, transport)
+
+    assert robo.assistants.runtimes.get('a').content.status == AssistantRuntimeStatus.RUNNING
+    with pytest.raises(NotFoundError):
+        robo.assistants.runtimes.get('missing')
+    transport.close()
+
+
+def test_async_requests_are_handled_like_requests(server):
+    transport = Http2Transport()
+    robo = make_robo(server, transport)
+
+    async def fetch():
+        try:
+            response = await robo.assistants.runtimes.get_async('a')
+            with pytest.raises(NotFoundError):
+                await robo.assistants.runtimes.get_async('missing')
+            return response
+        finally:
+            await transport.aclose()
+
+    assert asyncio.run(fetch()).content.status == AssistantRuntimeStatus.RUNNING
+
+
+def test_multipart_upload_is_streamed_with_content_length(server, tmp_path):
+    package = tmp_path / 'bot.zip'
+    package.write_bytes(os.urandom(200000))
+    transport = Http2Transport()
+
+    make_robo(server, transport).assistants.runtimes.update('a', str(package), 'base')
+    transport.close()
+
+    request = server.received[-1]
+    assert request['method'] == 'PUT'
+    assert int(request['headers']['Content-Length']) == len(request['body'])
+    assert 'Transfer-Encoding' not in request['headers']
+    assert request['headers']['Content-Type'].startswith('multipart/form-data')
+    assert package.read_bytes() in request['body']
+
+
+def test_authenticate_without_http_credentials(server):
+    transport = Http2Transport()
+
+    token = make_robo(server, transport).oauth.authenticate('api-key')
+    transport.close()
+
+    assert token.access_token == 'token'
+    assert 'Authorization' not in server.received[-1]['headers']
+
+
+def test_falls_back_to_requests_without_httpx(server, monkeypatch):
+    monkeypatch.setattr(http2_transport, 'httpx', None)
+    sent = []
+    send = RequestsTransport.send
+
+    def recording_send(self, method, url, **kwargs):
+        sent.append(url)
+        return send(self, method, url, **kwargs)
+
+    monkeypatch.setattr(RequestsTransport, 'send', recording_send)
+    with pytest.warns(UserWarning, match='httpx is not installed'):
+        transport = Http2Transport()
+
+    assert not transport.http2
+    assert make_robo(server, transport).assistants.runtimes.get('a').content.status == AssistantRuntimeStatus.RUNNING
+    assert len(sent) == 1
+
+
+def test_client_is_rebuilt_after_fork(server, monkeypatch):
+    transport = Http2Transport()
+    robo = make_robo(server, transport)
+
+    robo.assistants.runtimes.get('a')
+    robo.assistants.runtimes.get('a')
+    pid = os.getpid()
+    monkeypatch.setattr(os, 'getpid', lambda: pid + 1)
+    robo.assistants.runtimes.get('a')
+    transport.close()
+
+    ports = [request['port'] for request in server.received]
+    # the parent's connection is reused until the fork, then the child opens its own
+    assert ports[0] == ports[1] != ports[2]
@@ -0,0 +1,126 @@
+import time
+
+from robo_ai.model.config import Config
+from robo_ai.profiling.profiler import PhaseTimedStream, Profiler
+from robo_ai.robo_ai import RoboAi
+from robo_ai.transport.transport import Transport
+from robo_ai.transport.transport_response import TransportResponse
+
+
+class SlowStream(object):
+    len = 3
+
+    def __init__(self):
+        self.data = [b'abc']
+
+    def read(self, size=-1):
+        time.sleep(0.02)
+        return self.data.pop() if self.data else b''
+
+
+class UploadTransport(Transport):
+    def send(self, method, url, headers=None, params=None, data=None, json_data=None, files=None, auth=None):
+        while data.read(8192):
+            pass
+        body = b'{"content": {"assistantUuid": "a", "status": "RUNNING"}}'
+        return TransportResponse(200, body, {'Content-Type': 'application/json'})
+
+
+def stacks(profiler):
+    return {line.rsplit(' ', 1)[0]: int(line.rsplit(' ', 1)[1]) for line in profiler.collapsed_stacks()}
+
+
+def test_nested_phase_is_not_counted_twice():
+    profiler = Profiler()
+    stream = PhaseTimedStream(SlowStream(), profiler, 'encode')
+
+    with profiler.call('Resource.upload'):
+        with profiler.phase('network'):
+            while stream.read(1024):
+                pass
+
+    timings = stacks(profiler)
+    assert timings['Resource.upload;encode'] >= 35000
+    assert timings['Resource.upload;network'] < 10000
+    assert stream.len == 3
+
+
+def test_nested_calls_and_summary():
+    profiler = Profiler()
+
+    with profiler.call('Resource.update'):
+        with profiler.call('Resource._deploy_file'):
+            with profiler.phase('network'):
+                pass
+
+    assert set(stacks(profiler)) == {
+        'Resource.update',
+        'Resource.update;Resource._deploy_file',
+        'Resource.update;Resource._deploy_file;network',
+    }
+    summary = profiler.summary()
+    assert 'Resource.update' in summary and '  network' in summary
+
+
+def test_update_is_broken_down_into_phases(tmp_path):
+    package = tmp_path / 'bot.zip'
+    package.write_bytes(b'x' * 100000)
+    config = Config('http://localhost', {'username': None, 'password': None}, transport=UploadTransport())
+    profiler = config.profiler = Profiler()
+    robo = RoboAi(config)
+
+    robo.assistants.runtimes.update('a', str(package), 'base')
+
+    assert set(stacks(profiler)) == {
+        'AssistantRuntimesResource.update',
+        'AssistantRuntimesResource.update;auth',
+        'AssistantRuntimesResource.update;encode',
+        'AssistantRuntimesResource.update;network',
+        'AssistantRuntimesResource.update;json',
+        'AssistantRuntimesResource.update;structure',
+    }
+    assert '_deploy_file' not in profiler.summary()
+
+
+def test_unsampled_calls_are_not_recorded():
+    profiler = Profiler(sample_rate=0)
+
+    with profiler.call('Resource.get'):
+        with profiler.call('Resource.nested'):
+            with profiler.phase('network'):
+                pass
+
+    assert profiler.collapsed_stacks() == []
+
+
+def test_phases_outside_calls_are_ignored():
+    profiler = Profiler()
+
+    with profiler.phase('network'):
+        pass
+
+    assert profiler.collapsed_stacks() == []
+
+
+def test_dump_writes_folded_and_summary(tmp_path):
+    profiler = Profiler()
+    with profiler.call('Resource.get'):
+        pass
+
+    profiler.dump(str(tmp_path / 'profile'))
+
+    assert (tmp_path / 'profile.folded').read_text().startswith('Resource.get ')
+    assert 'Resource.get' in (tmp_path / 'profile.txt').read_text()
+
+
+def test_enable_profiling_keeps_a_single_exit_handler(monkeypatch):
+    registered = []
+    monkeypatch.setattr('atexit.register', registered.append)
+    monkeypatch.setattr('atexit.unregister', registered.remove)
+    robo = RoboAi(Config('http://localhost', http_auth={'username': None, 'password': None}))
+
+    robo.enable_profiling(output_path='first')
+    second = robo.enable_profiling(output_path='second')
+
+    assert len(registered) == 1
+    assert registered[0].func.__self__ is second
@@ -0,0 +1,109 @@
+import gzip
+
+import pytest
+
+from robo_ai.model.config import Config
+from robo_ai.robo_ai import RoboAi
+from robo_ai.transport.cassette import REDACTED_TOKEN, Cassette, CassetteEntry, request_key
+from robo_ai.transport.recording_transport import RecordingTransport
+from robo_ai.transport.replay_transport import ReplayTransport
+from robo_ai.transport.transport import Transport
+from robo_ai.transport.transport_response import TransportResponse
+
+
+class CountingTransport(Transport):
+    def __init__(self):
+        self.calls = 0
+
+    def send(self, method, url, headers=None, params=None, data=None, json_data=None, files=None, auth=None):
+        self.calls += 1
+        body = '{{"call": {0}}}'.format(self.calls).encode()
+        return TransportResponse(200, body, {'Content-Type': 'application/json'})
+
+
+class TokenTransport(Transport):
+    def send(self, method, url, headers=None, params=None, data=None, json_data=None, files=None, auth=None):
+        body = b'{"access_token": "SECRET-TOKEN", "token_type": "bearer", "expires_in": 3600, "scope": "all"}'
+        return TransportResponse(200, body, {'Content-Type': 'application/json'})
+
+
+def test_recorded_cassette_has_no_token(tmp_path):
+    path = str(tmp_path / 'cassette.gz')
+    recorder = RecordingTransport(path, TokenTransport())
+    robo = RoboAi(Config('http://live', {'username': None, 'password': None}, transport=recorder))
+
+    assert robo.oauth.authenticate('api-key').access_token == 'SECRET-TOKEN'
+    recorder.save()
+
+    with gzip.open(path, 'rt') as cassette_file:
+        content = cassette_file.read()
+    body = Cassette.decode_body(Cassette.load(path).entries[0].body)
+    assert 'SECRET-TOKEN' not in content
+    assert b'SECRET-TOKEN' not in body
+
+    replayed = RoboAi(Config('http://offline', {'username': None, 'password': None},
+                             transport=ReplayTransport(path)))
+    token = replayed.oauth.authenticate('api-key')
+    assert (token.access_token, token.expires_in) == (REDACTED_TOKEN, 3600)
+
+
+def test_redact_body_leaves_other_responses_untouched():
+    assert Cassette.redact_body('/api/assistants', b'{"access_token": "x"}') == b'{"access_token": "x"}'
+    assert Cassette.redact_body('/oauth/check_token/', b'{"active": true}') == b'{"active": true}'
+    assert Cassette.redact_body('/oauth/token', b'not json') == b'not json'
+
+
+def test_request_key_ignores_host_and_query_order():
+    first = request_key('get', 'http://one/api/assistants?b=2', {'a': 1})
+    second = request_key('GET', 'https://two/api/assistants?a=1&b=2')
+
+    assert first == second == ('GET', '/api/assistants', (('a', '1'), ('b', '2')))
+
+
+def test_cassette_round_trip(tmp_path):
+    path = str(tmp_path / 'cassette.gz')
+    entry = CassetteEntry(method='GET', path='/api/assistants', query=[('page', '1')], status_code=200,
+                          content_type='application/json', body=Cassette.encode_body(b'\x00\xffbinary'),
+                          elapsed=0.25)
+    Cassette([entry]).save(path)
+
+    loaded = Cassette.load(path)
+
+    assert len(loaded.entries) == 1
+    assert Cassette.decode_body(loaded.entries[0].body) == b'\x00\xffbinary'
+    assert list(loaded.by_key()) == [('GET', '/api/assistants', (('page', '1'),))]
+
+
+def test_replay_serves_recorded_responses_in_order(tmp_path):
+    path = str(tmp_path / 'cassette.gz')
+    recorder = RecordingTransport(path, CountingTransport())
+    recorder.send('get', 'http://live/api/assistants', params={'page': 1})
+    recorder.send('get', 'http://live/api/assistants', params={'page': 1})
+    recorder.send('get', 'http://live/api/assistants', params={'page': 2})
+    recorder.save()
+
+    replay = ReplayTransport(path)
+    bodies = [replay.send('get', 'http://offline/api/assistants', params={'page': 1}).json()['call']
+              for _ in range(3)]
+
+    assert bodies == [1, 2, 1]
+    assert replay.send('get', 'http://offline/api/assistants?page=2').json() == {'call': 3}
+
+
+def test_replay_unknown_request_raises(tmp_path):
+    path = str(tmp_path / 'cassette.gz')
+    Cassette().save(path)
+
+    with pytest.raises(LookupError):
+        ReplayTransport(path).send('get', 'http://offline/api/assistants')
+
+
+def test_replay_error_injection(tmp_path):
+    path = str(tmp_path / 'cassette.gz')
+    recorder = RecordingTransport(path, CountingTransport())
+    recorder.send('get', 'http://live/api/assistants')
+    recorder.save()
+
+    response = ReplayTransport(path, error_rate=1.0, error_status=502).send('get', 'http://offline/api/assistants')
+
+    assert response.status_code == 502
@@ -0,0 +1,147 @@
+import pytest
+
+from robo_ai.exception.not_found_error import NotFoundError
+from robo_ai.fleet.rolling_deploy import RollingDeploy
+from robo_ai.model.assistant_runtime.assistant_runtime import AssistantRuntime
+from robo_ai.model.assistant_runtime.assistant_runtime_response import AssistantRuntimeResponse
+from robo_ai.model.assistant_runtime.assistant_runtime_status import AssistantRuntimeStatus
+from robo_ai.model.config import Config
+from robo_ai.model.deploy.deploy_target import DeployTarget
+from robo_ai.profiling.profiler import Profiler
+
+
+class FakeRuntimes(object):
+    def __init__(self, statuses=None, failing=(), raising=()):
+        self.statuses = dict(statuses or {})
+        self.failing = set(failing)
+        self.raising = set(raising)
+        self.deployed = []
+        self.config = Config('http://localhost', http_auth={'username': None, 'password': None})
+
+    def get_config(self):
+        return self.config
+
+    def get(self, assistant_uuid):
+        if assistant_uuid not in self.statuses:
+            raise NotFoundError()
+        return AssistantRuntimeResponse(content=AssistantRuntime(assistantUuid=assistant_uuid,
+                                                                 status=self.statuses[assistant_uuid]))
+
+    def stop(self, assistant_uuid):
+        self.statuses[assistant_uuid] = AssistantRuntimeStatus.STOPPED
+
+    def _deploy_file(self, method, assistant_uuid, file_name, package_file, base_runtime, progress_callback=None):
+        if assistant_uuid in self.raising:
+            raise ValueError('malformed response')
+        self.deployed.append((method, assistant_uuid, package_file.read()))
+        failed = assistant_uuid in self.failing
+        self.statuses[assistant_uuid] = AssistantRuntimeStatus.DEAD if failed else AssistantRuntimeStatus.RUNNING
+
+
+def make_targets(tmp_path, uuids):
+    package = tmp_path / 'bot.zip'
+    package.write_bytes(b'package')
+    return [DeployTarget(uuid, str(package), 'base') for uuid in uuids]
+
+
+def test_plan_waves_starts_with_canary(tmp_path):
+    targets = make_targets(tmp_path, [str(index) for index in range(25)])
+    rollout = RollingDeploy(FakeRuntimes(), wave_size=10, canary_fraction=0.1)
+
+    waves = rollout.plan_waves(targets)
+
+    assert [len(wave) for wave in waves] == [3, 10, 10, 2]
+    assert [target for wave in waves for target in wave] == targets
+
+
+def test_plan_waves_without_canary(tmp_path):
+    targets = make_targets(tmp_path, ['a', 'b', 'c'])
+    rollout = RollingDeploy(FakeRuntimes(), wave_size=2, canary_fraction=0)
+
+    assert [len(wave) for wave in rollout.plan_waves(targets)] == [2, 1]
+    assert rollout.plan_waves([]) == []
+
+
+def test_run_creates_and_updates(tmp_path):
+    runtimes = FakeRuntimes({'a': AssistantRuntimeStatus.RUNNING})
+    targets = make_targets(tmp_path, ['a', 'b'])
+
+    report = RollingDeploy(runtimes, canary_fraction=0, poll_interval=0).run(targets)
+
+    assert not report.halted
+    operations = {result.assistant_uuid: result.operation for result in report.results}
+    assert operations == {'a': 'update', 'b': 'create'}
+    assert all(result.success for result in report.results)
+    assert sorted(data for _, _, data in runtimes.deployed) == [b'package', b'package']
+
+
+def test_uploads_are_profiled_as_rollout_calls(tmp_path):
+    runtimes = FakeRuntimes({'a': AssistantRuntimeStatus.RUNNING})
+    runtimes.config.profiler = Profiler()
+
+    RollingDeploy(runtimes, canary_fraction=0, poll_interval=0).run(make_targets(tmp_path, ['a', 'b']))
+
+    summary = runtimes.config.profiler.summary()
+    assert 'RollingDeploy.update' in summary and 'RollingDeploy.create' in summary
+
+
+def test_failed_wave_halts_rollout(tmp_path):
+    runtimes = FakeRuntimes(failing={'b'})
+    targets = make_targets(tmp_path, ['a', 'b', 'c', 'd'])
+
+    report = RollingDeploy(runtimes, wave_size=2, canary_fraction=0, poll_interval=0).run(targets)
+
+    assert report.halted
+    assert report.halt_reason == 'Wave 0: 1 of 2 deploys failed'
+    assert report.skipped == ['c', 'd']
+    failed = [result for result in report.results if not result.success]
+    assert failed[0].status == AssistantRuntimeStatus.DEAD
+
+
+def test_failure_ratio_below_threshold_continues(tmp_path):
+    runtimes = FakeRuntimes(failing={'b'})
+    targets = make_targets(tmp_path, ['a', 'b', 'c', 'd'])
+
+    report = RollingDeploy(runtimes, wave_size=2, canary_fraction=0, max_failure_ratio=0.5,
+                           poll_interval=0).run(targets)
+
+    assert not report.halted
+    assert len(report.results) == 4
+
+
+def test_unexpected_error_fails_only_its_target(tmp_path):
+    runtimes = FakeRuntimes(raising={'b'})
+    targets = make_targets(tmp_path, ['a', 'b', 'c'])
+
+    report = RollingDeploy(runtimes, wave_size=3, canary_fraction=0, max_failure_ratio=0.5,
+                           poll_interval=0).run(targets)
+
+    errors = {result.assistant_uuid: result.error for result in report.results}
+    assert errors == {'a': None, 'b': 'ValueError: malformed response', 'c': None}
+    assert not report.halted
+
+
+def test_report_to_dict_with_missing_status(tmp_path):
+    runtimes = FakeRuntimes(raising={'a'})
+
+    report = RollingDeploy(runtimes, canary_fraction=0, poll_interval=0).run(make_targets(tmp_path, ['a']))
+    data = report.to_dict()
+
+    assert data['halted'] is True
+    assert data['results'][0]['status'] is None
+    assert data['results'][0]['error'] == 'ValueError: malformed response'
+
+
+def test_interrupted_run_does_not_start_queued_deploys(tmp_path):
+    runtimes = FakeRuntimes()
+    targets = make_targets(tmp_path, [str(index) for index in range(50)])
+
+    def interrupt(result):
+        raise KeyboardInterrupt()
+
+    rollout = RollingDeploy(runtimes, concurrency=2, wave_size=50, canary_fraction=0, poll_interval=0,
+                            result_callback=interrupt)
+    with pytest.raises(KeyboardInterrupt):
+        rollout.run(targets)
+
+    assert len(runtimes.deployed) < 50
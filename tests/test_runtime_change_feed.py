@@ -0,0 +1,168 @@
+import asyncio
+
+import pytest
+
+from robo_ai.exception.invalid_credentials_error import InvalidCredentialsError
+from robo_ai.exception.not_found_error import NotFoundError
+from robo_ai.fleet.runtime_change_feed import RuntimeChangeFeed
+from robo_ai.model.assistant_runtime.assistant_runtime import AssistantRuntime
+from robo_ai.model.assistant_runtime.assistant_runtime_response import AssistantRuntimeResponse
+from robo_ai.model.assistant_runtime.assistant_runtime_status import AssistantRuntimeStatus
+
+
+class FakeRuntimes(object):
+    def __init__(self, statuses=None, raising=()):
+        self.statuses = dict(statuses or {})
+        self.raising = set(raising)
+        self.expired = False
+        self.calls = []
+        self.blocked = None
+
+    def get(self, assistant_uuid):
+        self.calls.append(assistant_uuid)
+        if self.expired:
+            raise InvalidCredentialsError()
+        if assistant_uuid in self.raising:
+            raise ValueError('malformed response')
+        if assistant_uuid not in self.statuses:
+            raise NotFoundError()
+        return AssistantRuntimeResponse(content=AssistantRuntime(assistantUuid=assistant_uuid,
+                                                                 status=self.statuses[assistant_uuid]))
+
+    async def get_async(self, assistant_uuid):
+        if self.blocked is not None:
+            await self.blocked.wait()
+        return self.get(assistant_uuid)
+
+
+def make_feed(runtimes, uuids, **kwargs):
+    intervals = dict(transient_interval=0, unhealthy_interval=0, stable_interval=0)
+    intervals.update(kwargs)
+    return RuntimeChangeFeed(runtimes, uuids, **intervals)
+
+
+def test_poll_reports_only_changes():
+    runtimes = FakeRuntimes({'a': AssistantRuntimeStatus.RUNNING, 'b': AssistantRuntimeStatus.STOPPED})
+    feed = make_feed(runtimes, ['a', 'b'])
+    notified = []
+    feed.subscribe(notified.append)
+
+    assert feed.poll() == []
+    assert feed.snapshot == {'a': AssistantRuntimeStatus.RUNNING, 'b': AssistantRuntimeStatus.STOPPED}
+
+    runtimes.statuses['a'] = AssistantRuntimeStatus.DEAD
+    changes = feed.poll()
+
+    assert [(change.assistant_uuid, change.previous_status, change.status) for change in changes] == [
+        ('a', AssistantRuntimeStatus.RUNNING, AssistantRuntimeStatus.DEAD)]
+    assert notified == changes
+
+
+def test_notify_initial_and_missing_runtime():
+    feed = make_feed(FakeRuntimes({'a': AssistantRuntimeStatus.RUNNING}), ['a', 'gone'], notify_initial=True)
+
+    changes = feed.poll()
+
+    assert {(change.assistant_uuid, change.previous_status, change.status) for change in changes} == {
+        ('a', None, AssistantRuntimeStatus.RUNNING), ('gone', None, None)}
+
+
+def test_runtimes_are_rescheduled_by_priority():
+    runtimes = FakeRuntimes({'a': AssistantRuntimeStatus.STARTING})
+    feed = make_feed(runtimes, ['a'], transient_interval=5, unhealthy_interval=15, stable_interval=120)
+
+    feed.poll()
+    assert 5 <= feed.seconds_until_next_poll() <= 5.5
+    assert feed.poll() == []
+    assert runtimes.calls == ['a']
+
+    feed = make_feed(runtimes, ['a'], transient_interval=0, stable_interval=120)
+    runtimes.statuses['a'] = AssistantRuntimeStatus.RUNNING
+    feed.poll()
+    assert feed.seconds_until_next_poll() > 100
+
+
+def test_failed_fetch_keeps_status_and_reschedules():
+    runtimes = FakeRuntimes({'a': AssistantRuntimeStatus.RUNNING, 'b': AssistantRuntimeStatus.RUNNING})
+    feed = make_feed(runtimes, ['a', 'b'])
+    feed.poll()
+
+    runtimes.raising.add('a')
+    runtimes.statuses['b'] = AssistantRuntimeStatus.STOPPED
+
+    with pytest.warns(UserWarning, match='1 of 2 runtimes could not be fetched, last error ValueError'):
+        assert [change.assistant_uuid for change in feed.poll()] == ['b']
+    assert feed.snapshot['a'] == AssistantRuntimeStatus.RUNNING
+
+    runtimes.raising.clear()
+    runtimes.calls.clear()
+    feed.poll()
+    assert sorted(runtimes.calls) == ['a', 'b']
+
+
+def test_auth_errors_end_the_cycle_and_keep_the_runtimes():
+    runtimes = FakeRuntimes({'a': AssistantRuntimeStatus.RUNNING, 'b': AssistantRuntimeStatus.RUNNING})
+    feed = make_feed(runtimes, ['a', 'b'])
+    runtimes.expired = True
+
+    with pytest.raises(InvalidCredentialsError):
+        feed.poll()
+    with pytest.raises(InvalidCredentialsError):
+        asyncio.run(feed.poll_async())
+    with pytest.raises(InvalidCredentialsError):
+        feed.run()
+
+    runtimes.expired = False
+    runtimes.calls.clear()
+    feed.poll()
+    assert sorted(runtimes.calls) == ['a', 'b']
+
+
+def test_raising_subscriber_does_not_stop_the_others():
+    runtimes = FakeRuntimes({'a': AssistantRuntimeStatus.RUNNING})
+    feed = make_feed(runtimes, ['a'], notify_initial=True)
+    notified = []
+
+    def broken(change):
+        raise RuntimeError('subscriber bug')
+
+    feed.subscribe(broken)
+    feed.subscribe(notified.append)
+
+    with pytest.warns(UserWarning, match='subscriber bug'):
+        changes = feed.poll()
+
+    assert notified == changes
+    assert feed.seconds_until_next_poll() == 0
+
+
+def test_cancelled_poll_async_reschedules():
+    runtimes = FakeRuntimes({'a': AssistantRuntimeStatus.RUNNING})
+    feed = make_feed(runtimes, ['a'])
+
+    async def cancel_mid_cycle():
+        runtimes.blocked = asyncio.Event()
+        task = asyncio.ensure_future(feed.poll_async())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        runtimes.blocked = None
+        return await feed.poll_async()
+
+    asyncio.run(cancel_mid_cycle())
+
+    assert runtimes.calls == ['a']
+    assert feed.snapshot == {'a': AssistantRuntimeStatus.RUNNING}
+
+
+def test_removed_runtime_is_forgotten():
+    runtimes = FakeRuntimes({'a': AssistantRuntimeStatus.RUNNING})
+    feed = make_feed(runtimes, ['a'])
+    feed.poll()
+
+    feed.remove('a')
+
+    assert feed.snapshot == {}
+    assert feed.seconds_until_next_poll() is None
+    assert feed.poll() == []
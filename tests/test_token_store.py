@@ -0,0 +1,75 @@
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from robo_ai.model.auth.access_token import AccessToken
+from robo_ai.token_store.file_token_store import FileTokenStore
+from robo_ai.token_store.token_store import MemoryTokenStore, TokenStore
+
+
+def slow_fetch(counter, expires_in=3600):
+    def fetch():
+        with counter.get_lock():
+            counter.value += 1
+            number = counter.value
+        time.sleep(0.1)
+        return AccessToken('token-{0}'.format(number), 'bearer', expires_in, 'scope')
+    return fetch
+
+
+def get_from_file_store(path, counter, results):
+    results.put(FileTokenStore(path).get_token('key', slow_fetch(counter)).access_token)
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+def test_file_store_fetches_once_across_processes(tmp_path):
+    context = multiprocessing.get_context('fork')
+    counter = context.Value('i', 0)
+    results = context.Queue()
+    path = str(tmp_path / 'tokens.json')
+
+    processes = [context.Process(target=get_from_file_store, args=(path, counter, results)) for _ in range(6)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(10)
+
+    assert counter.value == 1
+    assert {results.get(timeout=1) for _ in processes} == {'token-1'}
+
+
+@pytest.mark.parametrize('make_store', [lambda path: FileTokenStore(path), lambda path: MemoryTokenStore()])
+def test_store_fetches_once_across_threads(tmp_path, make_store):
+    store = make_store(str(tmp_path / 'tokens.json'))
+    counter = multiprocessing.Value('i', 0)
+    tokens = []
+
+    threads = [threading.Thread(target=lambda: tokens.append(store.get_token('key', slow_fetch(counter))))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value == 1
+    assert {token.access_token for token in tokens} == {'token-1'}
+
+
+def test_expiring_token_is_refreshed(tmp_path):
+    store = FileTokenStore(str(tmp_path / 'tokens.json'), leeway=60)
+    counter = multiprocessing.Value('i', 0)
+
+    first = store.get_token('key', slow_fetch(counter, expires_in=30))
+    second = store.get_token('key', slow_fetch(counter))
+
+    assert (first.access_token, second.access_token) == ('token-1', 'token-2')
+    assert second.expires_in > 3000
+
+
+def test_make_key_hides_api_key():
+    key = TokenStore.make_key('https://api', 'secret')
+
+    assert 'secret' not in key
+    assert key != TokenStore.make_key('https://other', 'secret')